@@ -1,8 +1,20 @@
-import pdfplumber
 import sys
 from typing import List, Dict
 from utils import *  # Import shared: to_float, normalize_date, etc.
 
+# Variant-specific: Adjusted table settings (e.g., for Zenith/First Bank type with denser tables)
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines_strict",  # Variant tweak: Stricter lines
+    "horizontal_strategy": "lines_strict",
+    "explicit_vertical_lines": [],
+    "explicit_horizontal_lines": [],
+    "snap_tolerance": 2,  # Tighter snap for this variant
+    "join_tolerance": 2,
+    "min_words_vertical": 2,  # Allow shorter vertical text
+    "min_words_horizontal": 1,
+    "text_tolerance": 0.5,  # More precise text alignment
+}
+
 
 def parse(path: str) -> List[Dict[str, str]]:
     transactions = []
@@ -10,22 +22,10 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_header_map = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"Processing page {page_num}", file=sys.stderr)
-                # Variant-specific: Adjusted table settings (e.g., for Zenith/First Bank type with denser tables)
-                table_settings = {
-                    "vertical_strategy": "lines_strict",  # Variant tweak: Stricter lines
-                    "horizontal_strategy": "lines_strict",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 2,  # Tighter snap for this variant
-                    "join_tolerance": 2,
-                    "min_words_vertical": 2,  # Allow shorter vertical text
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 0.5,  # More precise text alignment
-                }
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(TABLE_SETTINGS)
 
                 # The rest is the same as universal.py - copy the extraction logic here
                 # ... (paste the if tables: ... else: ... block from universal.py)
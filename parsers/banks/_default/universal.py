@@ -1,6 +1,4 @@
 import sys
-import re
-import pdfplumber
 from typing import List, Dict
 from utils import (
     normalize_column_name,
@@ -10,6 +8,8 @@ from utils import (
     to_float,
     parse_text_row,
     calculate_checks,
+    open_pdf,
+    RX_DATE_LINE,
 )
 
 
@@ -18,7 +18,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(default): Processing page {page_num}", file=sys.stderr)
 
@@ -85,10 +85,8 @@ def parse(path: str) -> List[Dict[str, str]]:
                             if len(row) < len(global_headers):
                                 row.extend([""] * (len(global_headers) - len(row)))
 
-                            row_dict = {
-                                global_headers[i]: row[i] if i < len(row) else ""
-                                for i in range(len(global_headers))
-                            }
+                            # Short rows were padded above, so zip pairs every column
+                            row_dict = dict(zip(global_headers, row))
 
                             standardized_row = {
                                 "TXN_DATE": normalize_date(
@@ -151,7 +149,7 @@ def parse(path: str) -> List[Dict[str, str]]:
                         lines = text.split("\n")
                         current_row = []
                         for line in lines:
-                            if re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line):
+                            if RX_DATE_LINE.match(line):
                                 if current_row:
                                     transactions.append(
                                         parse_text_row(current_row, global_headers)
@@ -1,4 +1,3 @@
-import pdfplumber
 import re
 import sys
 from typing import Callable, Optional, List, Dict
@@ -6,6 +5,7 @@ from .universal import parse as parse_universal
 from .model_01 import parse as parse_001
 from .model_02 import parse as parse_002
 from .model_03 import parse as parse_003
+from utils import open_pdf
 
 # Map variant keys directly to their parser functions
 PARSER_MAP: Dict[str, Callable[[str], List[Dict[str, str]]]] = {
@@ -29,7 +29,7 @@ VARIANT_PATTERNS = {
 
 def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]:
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             if not pdf.pages:
                 return None
 
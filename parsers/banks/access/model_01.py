@@ -1,21 +1,23 @@
 import re
-import pdfplumber
 from typing import List, Dict
 
 from utils import (
     normalize_date,
     normalize_money,
     calculate_checks,
+    open_pdf,
 )
 
 # Regex patterns
 RX_TXN_DATE = re.compile(r"^\d{1,2}/\d{1,2}/\d{4}")
 RX_VAL_DATE = re.compile(r"\d{2}-[A-Z]{3}-\d{4}")
 RX_AMOUNT = re.compile(r"[-\d,]+\.\d{2}")
+RX_REMARKS_DATE = re.compile(r"\b\d{2}-[A-Za-z]{3}-\d{4}\b")
+RX_MULTI_SPACE = re.compile(r"\s{2,}")
 
 
 def extract_fields(remarks: str) -> Dict[str, str]:
-    date_pattern = re.compile(r"\b\d{2}-[A-Za-z]{3}-\d{4}\b")
+    date_pattern = RX_REMARKS_DATE
     amount_pattern = RX_AMOUNT
     # amount_pattern = re.compile(r"\d[\d,]*\.\d{2}")
 
@@ -54,7 +56,7 @@ def extract_fields(remarks: str) -> Dict[str, str]:
             cleaned = cleaned.replace(val, "", 1)
 
     # Final clean up of extra spaces
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    cleaned = RX_MULTI_SPACE.sub(" ", cleaned).strip()
 
     return {
         "VAL_DATE": val_date,
@@ -69,10 +71,10 @@ def extract_fields(remarks: str) -> Dict[str, str]:
 def parse(path: str) -> List[Dict[str, str]]:
     transactions: List[Dict[str, str]] = []
 
-    with pdfplumber.open(path) as pdf:
+    with open_pdf(path) as pdf:
         for page_no, page in enumerate(pdf.pages, start=1):
             text = page.extract_text() or ""
-            lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+            lines = [ln for ln in map(str.strip, text.splitlines()) if ln]
 
             buffer = {}
             remarks_parts = []
@@ -1,4 +1,3 @@
-import pdfplumber
 import sys
 from typing import List, Dict
 from utils import (
@@ -7,6 +6,7 @@ from utils import (
     MAIN_TABLE_SETTINGS,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
 
@@ -15,12 +15,10 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(access:002): Processing page {page_num}", file=sys.stderr)
-                # Table extraction settings
-                table_settings = MAIN_TABLE_SETTINGS.copy()
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if tables:
                     for table in tables:
@@ -1,7 +1,6 @@
 # banks/access/parser_003.py
 import re
 import sys
-import pdfplumber
 from typing import List, Dict, Optional
 
 from utils import (
@@ -11,6 +10,7 @@ from utils import (
     normalize_date,
     normalize_money,
     calculate_checks,
+    open_pdf,
 )
 
 # Known header layout (we'll use normalized form for parse_text_row when possible)
@@ -35,6 +35,7 @@ RX_AMOUNT = re.compile(r"-?\d{1,3}(?:,\d{3})*(?:\.\d{2})?")  # amounts with comm
 
 RX_REF_DIGITS = re.compile(r"\b\d{6,}\b")
 RX_REF_ALNUM = re.compile(r"\b[A-Z0-9_]{6,}\b", re.IGNORECASE)
+RX_LEADING_SERIAL = re.compile(r"^\d{1,3}\s+")
 
 RX_REFERENCE = re.compile(
     r"(PP_[A-Z0-9_]{3,}(?:\s*\d+[A-Z0-9_]*\s*){0,3}_+)",  # Handles multi-line, like "PP_SUSP_1655 47_1063874174 _"
@@ -136,10 +137,10 @@ def _parse_freestyle_row(row_cells: List[Optional[str]]) -> Dict[str, str]:
     # remove amounts
     cleaned = RX_AMOUNT.sub(" ", cleaned)
     # collapse whitespace
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = " ".join(cleaned.split())
 
     # Remove leading serial numbers or index numbers like "1 " or "01 " at start
-    cleaned = re.sub(r"^\d{1,3}\s+", "", cleaned)
+    cleaned = RX_LEADING_SERIAL.sub("", cleaned)
 
     out["REMARKS"] = cleaned
 
@@ -203,11 +204,10 @@ def parse(path: str) -> List[Dict[str, str]]:
     normalized_headers_no_serial = normalized_headers[1:]
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, start=1):
                 print(f"(access:003): Processing page {page_num}", file=sys.stderr)
-                table_settings = MAIN_TABLE_SETTINGS.copy()
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if not tables:
                     print(
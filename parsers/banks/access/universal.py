@@ -1,10 +1,10 @@
 # banks/access/universal.py
-import pdfplumber
 import re
 import sys
 from typing import List, Dict
 from utils import (
     FIELD_MAPPINGS,
+    MAIN_TABLE_SETTINGS,
     is_two_digit_year,
     ends_with_month_dash,
     normalize_date,
@@ -14,6 +14,7 @@ from utils import (
     parse_text_row,
     normalize_column_name,
     calculate_checks,
+    open_pdf,
 )
 
 # ---------- helpers ----------
@@ -107,22 +108,11 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(access parser): Processing page {page_num}", file=sys.stderr)
 
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 1,
-                }
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if not tables:
                     # Fallback text mode
@@ -1,10 +1,9 @@
 # banks/alternative/universal.py
 import sys
 import re
-import pdfplumber
 from typing import List, Dict, Optional
 
-from utils import normalize_date, to_float, calculate_checks, STANDARDIZED_ROW
+from utils import normalize_date, to_float, calculate_checks, STANDARDIZED_ROW, open_pdf
 
 # Patterns
 FULL_DATE_SEARCH = re.compile(r"(\d{1,2}-[A-Za-z]{3}-\d{4})")  # e.g. 17-Jul-2025
@@ -13,6 +12,9 @@ PARTIAL_MONTH_YEAR_AT_START = re.compile(
 )  # -Jan-2025 or Jan-2025
 AMOUNT_RE = re.compile(r"[\d,]+\.\d{2}")
 NUMERIC_REF = re.compile(r"^\d{4,}$")  # numeric-only reference (4+ digits)
+TRAILING_DAY = re.compile(r"(\b\d{1,2})[-]?\s*$")  # day split from "-Jan-2025"
+ALNUM_REF = re.compile(r"\b[A-Za-z0-9]{3,}\b")
+REMARKS_JUNK_CHARS = re.compile(r"[^\w\s.,&/()-]")
 
 JUNK_PHRASES = [
     "opening balance",
@@ -41,7 +43,7 @@ def _merge_split_date_lines(raw_lines: List[str]) -> List[str]:
             # next line looks like '-Jan-2025' or 'Jan-2025' at the start
             if PARTIAL_MONTH_YEAR_AT_START.match(nxt.strip()):
                 # current line ends with a standalone day (like '01' or '1' possibly trailing '-')
-                m = re.search(r"(\b\d{1,2})[-]?\s*$", line)
+                m = TRAILING_DAY.search(line)
                 if m:
                     combined = line.rstrip() + " " + nxt.lstrip()
                     merged.append(combined)
@@ -111,7 +113,7 @@ def _build_transaction_from_lines(
                 reference = first_tok
             else:
                 # try alphanumeric ref fallback (short)
-                m_ref = re.search(r"\b[A-Za-z0-9]{3,}\b", after_date)
+                m_ref = ALNUM_REF.search(after_date)
                 if m_ref and not m_ref.group(0).lower() in (
                     "from",
                     "to",
@@ -159,8 +161,8 @@ def _build_transaction_from_lines(
         # remove money tokens text
         remainder = AMOUNT_RE.sub(" ", remainder)
         # strip weird chars left behind, collapse whitespace
-        remarks = re.sub(r"[^\w\s.,&/()-]", " ", remainder)
-        remarks = re.sub(r"\s+", " ", remarks).strip()
+        remarks = REMARKS_JUNK_CHARS.sub(" ", remainder)
+        remarks = " ".join(remarks.split())
 
         # debit/credit decision by previous balance change
         debit, credit = "0.00", "0.00"
@@ -178,18 +180,15 @@ def _build_transaction_from_lines(
             debit = "0.00"
             credit = "0.00"
 
+        # Assign into the template copy directly; no temporary dict for update()
         txn = STANDARDIZED_ROW.copy()
-        txn.update(
-            {
-                "TXN_DATE": txn_date,
-                "VAL_DATE": txn_date,
-                "REFERENCE": reference,
-                "REMARKS": remarks,
-                "DEBIT": debit,
-                "CREDIT": credit,
-                "BALANCE": f"{bal_val:.2f}",
-            }
-        )
+        txn["TXN_DATE"] = txn_date
+        txn["VAL_DATE"] = txn_date
+        txn["REFERENCE"] = reference
+        txn["REMARKS"] = remarks
+        txn["DEBIT"] = debit
+        txn["CREDIT"] = credit
+        txn["BALANCE"] = f"{bal_val:.2f}"
         return txn
     except Exception as e:
         print(
@@ -204,7 +203,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     prev_balance: Optional[float] = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, start=1):
                 print(f"(alternative): Processing page {page_num}", file=sys.stderr)
                 text = page.extract_text()
@@ -263,7 +262,7 @@ def parse(path: str) -> List[Dict[str, str]]:
 
         # post-clean remarks
         for t in transactions:
-            t["REMARKS"] = re.sub(r"\s+", " ", t["REMARKS"]).strip()
+            t["REMARKS"] = " ".join(t["REMARKS"].split())
 
         # keep only transactions with a date (we try to avoid inventing dates)
         final_txns = [t for t in transactions if t["TXN_DATE"]]
@@ -1,6 +1,5 @@
 import sys
 import re
-import pdfplumber
 from typing import List, Dict, Optional
 
 from utils import (
@@ -8,6 +7,7 @@ from utils import (
     normalize_money,
     to_float,
     calculate_checks,
+    open_pdf,
 )
 
 # Matches: 25/Aug/2025
@@ -33,7 +33,7 @@ def _norm_altpro_date(d: str) -> str:
 
 def _clean_narration(text: str) -> str:
     # Collapse whitespace, remove repeated headers if they leak in
-    t = re.sub(r"\s+", " ", text or "").strip()
+    t = " ".join((text or "").split())
     t = re.sub(RX_HEADER, "", t).strip()
     return t
 
@@ -147,7 +147,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     current_block: List[str] = []
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(altpro_model_01): Processing page {page_num}", file=sys.stderr)
 
@@ -1,6 +1,4 @@
 import sys
-import re
-import pdfplumber
 from typing import List, Dict
 
 from utils import (
@@ -11,6 +9,8 @@ from utils import (
     to_float,
     parse_text_row,
     calculate_checks,
+    open_pdf,
+    RX_DATE_LINE,
 )
 
 
@@ -19,7 +19,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(altpro): Processing page {page_num}", file=sys.stderr)
 
@@ -88,7 +88,7 @@ def parse(path: str) -> List[Dict[str, str]]:
                         lines = text.split("\n")
                         current_row = []
                         for line in lines:
-                            if re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line):
+                            if RX_DATE_LINE.match(line):
                                 if current_row:
                                     transactions.append(
                                         parse_text_row(current_row, global_headers)
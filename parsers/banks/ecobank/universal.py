@@ -1,14 +1,15 @@
 import sys
 import re
-import pdfplumber
 from typing import List, Dict
 from utils import (
     normalize_column_name,
     FIELD_MAPPINGS,
+    MAIN_TABLE_SETTINGS,
     normalize_money,
     to_float,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
 # --------- Helpers for light validation / header repair ----------
@@ -50,23 +51,11 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers: List[str] | None = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(ecobank): Processing page {page_num}", file=sys.stderr)
 
-                # Table extraction settings
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 1,
-                }
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if tables:
                     for table in tables:
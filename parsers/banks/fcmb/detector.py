@@ -1,10 +1,10 @@
-import pdfplumber
 import re
 import sys
 from typing import Callable, Optional, List, Dict
 from .universal import parse as parse_universal
 from .model_01 import parse as parse_model_01
 from .model_02 import parse as parse_model_02
+from utils import open_pdf
 
 # Map variant keys directly to their parser functions
 PARSER_MAP: Dict[str, Callable[[str], List[Dict[str, str]]]] = {
@@ -36,7 +36,7 @@ def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]
     Returns the appropriate parser function.
     """
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             if not pdf.pages:
                 return None
 
@@ -1,13 +1,13 @@
 # banks/fcmb/parser_001.py
 import sys
 import re
-import pdfplumber
 from typing import List, Dict, Optional
 
 from utils import (
     normalize_date,
     to_float,
     calculate_checks,
+    open_pdf,
 )
 
 # Date patterns seen on FCMB (e.g., 01-Jan-2025, 01/01/2025, 01-01-2025)
@@ -80,7 +80,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     records: List[Dict[str, str]] = []
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             # We’ll build a flat list of textual lines across all pages
             raw_lines: List[str] = []
             for pno, page in enumerate(pdf.pages, 1):
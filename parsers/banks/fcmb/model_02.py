@@ -1,10 +1,9 @@
 # banks/fcmb/model_02.py
 import re
 import sys
-import pdfplumber
 from typing import List, Dict, Optional
 
-from utils import normalize_date, to_float, calculate_checks
+from utils import normalize_date, to_float, calculate_checks, open_pdf
 
 DATE_RX = re.compile(r"^(?P<d>\d{2}\s+[A-Za-z]{3}\s+\d{4})\b")
 MONEY_RX = re.compile(r"^-?\d{1,3}(?:,\d{3})*(?:\.\d{2})?$")
@@ -23,7 +22,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     rows: List[Dict[str, str]] = []
     prev_balance: Optional[float] = None
 
-    with pdfplumber.open(path) as pdf:
+    with open_pdf(path) as pdf:
         for pno, page in enumerate(pdf.pages, 1):
             print(f"(fcmb:model_02) page {pno}", file=sys.stderr)
             text = page.extract_text() or ""
@@ -1,5 +1,4 @@
 import sys
-import pdfplumber
 from typing import List, Dict
 
 from utils import (
@@ -8,6 +7,7 @@ from utils import (
     MAIN_TABLE_SETTINGS,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
 
@@ -16,7 +16,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(fcmb): Processing page {page_num}", file=sys.stderr)
 
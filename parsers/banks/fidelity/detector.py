@@ -2,11 +2,11 @@
 import sys
 import re
 from typing import Callable, Optional, List, Dict, Any
-import pdfplumber
 
 from .universal import parse as parse_universal
 from .model_01 import parse as model_01
 from .model_02 import parse as model_02
+from utils import open_pdf
 
 
 # Map variant keys directly to their parser functions
@@ -24,7 +24,7 @@ VARIANT_PATTERNS = {
 
 def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]:
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             if not pdf.pages:
                 return None
 
@@ -1,9 +1,8 @@
 # banks/fidelity/parser_summary.py
 import sys
 import re
-import pdfplumber
 from typing import List, Dict
-from utils import normalize_date, calculate_checks
+from utils import normalize_date, calculate_checks, open_pdf
 
 AMOUNT_RE = re.compile(r"\d{1,3}(?:,\d{3})*\.\d{2}")
 TXN_LINE_RE = re.compile(
@@ -11,6 +10,8 @@ TXN_LINE_RE = re.compile(
 )
 FOOTER_DATE_RE = re.compile(r"^\d{2}/\d{2}/\d{4}$")
 PAGE_OF_RE = re.compile(r"^\d+\s+of\s+\d+$")
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
+FROM_RE = re.compile(r"\bFROM\b", re.I)
 
 # Heals common PDF token splits inside amounts like "9 011,290.41" → "9,011,290.41",
 # ", 000" → ",000", and "50 .00" → "50.00"
@@ -48,7 +49,7 @@ def _strip_last_amounts(s: str, k: int = 2) -> str:
     out = s
     for start, end in sorted(spans, key=lambda x: x[0], reverse=True):
         out = out[:start].rstrip() + " " + out[end:].lstrip()
-    return re.sub(r"\s{2,}", " ", out).strip()
+    return MULTI_SPACE_RE.sub(" ", out).strip()
 
 
 def parse(path: str) -> List[Dict[str, str]]:
@@ -81,7 +82,7 @@ def parse(path: str) -> List[Dict[str, str]]:
             elif delta < 0:
                 debit = amount
         elif amount is not None:
-            if re.search(r"\bFROM\b", details, re.I):
+            if FROM_RE.search(details):
                 credit = amount
             else:
                 debit = amount
@@ -105,7 +106,7 @@ def parse(path: str) -> List[Dict[str, str]]:
         pending = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(
                     f"(fidelity:summary): Processing page {page_num}", file=sys.stderr
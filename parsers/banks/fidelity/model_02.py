@@ -3,19 +3,19 @@ import sys
 import re
 from typing import List, Dict, Optional
 
-import pdfplumber
-
 from utils import (
     MAIN_TABLE_SETTINGS,
     normalize_date,
     normalize_money,
     to_float,
     calculate_checks,
+    open_pdf,
 )
 
 # --- Patterns for this Fidelity layout ---
 DATE_RE = re.compile(r"\b\d{2}-[A-Za-z]{3}-\d{4}\b")  # 01-Jul-2025
 AMT_RE = re.compile(r"\b\d[\d,]*\.\d{2}\b")  # 4,221,845.19 / 53.75
+PAREN_AMT_RE = re.compile(r"\(\s*\d[\d,]*\.\d{2}\s*\)")  # (1,234.56)
 
 
 CHANNEL_PATTERNS = {
@@ -47,17 +47,13 @@ def _is_fidelity_model02_header(row: List[Optional[str]]) -> bool:
 
 
 def _extract_channel_and_remarks(text: str) -> tuple[str, str]:
-    clean = re.sub(r"\s+", " ", text).strip()
+    clean = " ".join(text.split())
 
     # Try longer canonical channel names first (more specific)
-    for channel in sorted(CHANNEL_PATTERNS.keys(), key=len, reverse=True):
-        aliases = CHANNEL_PATTERNS[channel]
-
-        for alias in aliases:
-            # Match alias at end
-            # We'll build a "tail" regex: (.*) <alias>$
-            alias_re = _alias_to_regex(alias)
-            m = re.match(rf"^(.*)({alias_re.pattern})\s*$", clean, flags=re.IGNORECASE)
+    for channel, alias_regexes in CHANNEL_REGEXES:
+        for _, tail_re in alias_regexes:
+            # Match alias at end: (.*) <alias>$
+            m = tail_re.match(clean)
             if m:
                 remarks = (m.group(1) or "").strip()
                 return channel, remarks
@@ -83,10 +79,24 @@ def _alias_to_regex(alias) -> re.Pattern:
     return re.compile(r"\b" + r"\s+".join(words) + r"\b", re.IGNORECASE)
 
 
+# Channels longest name first, each with its (alias, "(.*) <alias>$" tail) regexes;
+# built once here rather than on every row
+CHANNEL_REGEXES = [
+    (
+        channel,
+        [
+            (alias_re, re.compile(rf"^(.*)({alias_re.pattern})\s*$", re.IGNORECASE))
+            for alias_re in map(_alias_to_regex, CHANNEL_PATTERNS[channel])
+        ],
+    )
+    for channel in sorted(CHANNEL_PATTERNS, key=len, reverse=True)
+]
+
+
 def _find_any_channel_in_text(text: str) -> str:
-    for channel in sorted(CHANNEL_PATTERNS.keys(), key=len, reverse=True):
-        for alias in CHANNEL_PATTERNS[channel]:
-            if _alias_to_regex(alias).search(text):
+    for channel, alias_regexes in CHANNEL_REGEXES:
+        for alias_re, _ in alias_regexes:
+            if alias_re.search(text):
                 return channel
     return ""
 
@@ -105,7 +115,7 @@ def _parse_compact_row(cell: str) -> Optional[Dict[str, str]]:
 
     raw = str(cell)
     # Keep a whitespace-normalized version for slicing + regex searching
-    all_text = re.sub(r"\s+", " ", raw.replace("\n", " ")).strip()
+    all_text = " ".join(raw.split())
 
     date_iters = list(DATE_RE.finditer(all_text))
     if len(date_iters) < 2:
@@ -122,7 +132,7 @@ def _parse_compact_row(cell: str) -> Optional[Dict[str, str]]:
 
     # Detect parentheses-based negative balance BEFORE extraction
     is_balance_negative = False
-    paren_balance_match = re.search(r"\(\s*\d[\d,]*\.\d{2}\s*\)", after_dates)
+    paren_balance_match = PAREN_AMT_RE.search(after_dates)
     if paren_balance_match:
         is_balance_negative = True
 
@@ -184,7 +194,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     transactions: List[Dict[str, str]] = []
     prev_balance: Optional[float] = None
 
-    with pdfplumber.open(path) as pdf:
+    with open_pdf(path) as pdf:
         for page_num, page in enumerate(pdf.pages, 1):
             print(f"(fidelity model_02): Processing page {page_num}", file=sys.stderr)
 
@@ -1,11 +1,12 @@
 # banks/fidelity/universal.py
 import sys
 import re
-import pdfplumber
 from typing import List, Dict
-from utils import normalize_date, calculate_checks
+from utils import normalize_date, calculate_checks, open_pdf
 
 AMOUNT_RE = re.compile(r"\d{1,3}(?:,\d{3})*\.\d{2}")
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
+FROM_RE = re.compile(r"\bFROM\b", re.I)
 
 
 def _extract_amounts(s: str):
@@ -27,7 +28,7 @@ def _strip_last_amounts(s: str, k: int = 2) -> str:
     # Remove from right to left so indices don’t shift
     for start, end in sorted(spans, key=lambda x: x[0], reverse=True):
         out = out[:start].rstrip() + " " + out[end:].lstrip()
-    return re.sub(r"\s{2,}", " ", out).strip()
+    return MULTI_SPACE_RE.sub(" ", out).strip()
 
 
 def parse(path: str) -> List[Dict[str, str]]:
@@ -61,7 +62,7 @@ def parse(path: str) -> List[Dict[str, str]]:
         elif amount is not None:
             # Heuristic fallback if opening balance missing in text segment
             # Bias towards 'FROM' => credit; else debit
-            if re.search(r"\bFROM\b", details, re.I):
+            if FROM_RE.search(details):
                 credit = amount
             else:
                 debit = amount
@@ -93,7 +94,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     page_of_re = re.compile(r"^\d+\s+of\s+\d+$")  # e.g., 1 of 5
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(fidelity): Processing page {page_num}", file=sys.stderr)
                 text = page.extract_text(x_tolerance=1, y_tolerance=1) or ""
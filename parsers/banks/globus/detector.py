@@ -1,8 +1,8 @@
-import pdfplumber
 import re
 import sys
 from typing import Callable, Optional, List, Dict
 from .universal import parse as parse_universal
+from utils import open_pdf
 
 # Import more as you add variants, e.g.:
 # from .parser_001 import parse as parse_001
@@ -16,7 +16,7 @@ VARIANT_PATTERNS = {
 
 def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]:
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             if not pdf.pages:
                 return None
             text = pdf.pages[0].extract_text() or ""  # Check first page
@@ -1,4 +1,3 @@
-import pdfplumber
 import re
 import sys
 from typing import List, Dict, Optional
@@ -7,6 +6,7 @@ from utils import (
     normalize_money,
     calculate_checks,
     merge_and_drop_year_artifacts,
+    open_pdf,
 )
 
 # === Regex patterns ===
@@ -20,6 +20,11 @@ RX_FOOTER = re.compile(
     r"(statement summary|closing balance|account summary|please address|opening balance|total|balance carried forward)",
     re.I,
 )
+RX_YEAR_LINE = re.compile(r"^\d{4}$")
+RX_DEBIT_HINT = re.compile(r"\bwithdraw|debit|dr\b", re.I)
+RX_MULTI_SPACE = re.compile(r"\s{2,}")
+RX_ALNUM = re.compile(r"[0-9A-Za-z]")
+RX_TIME_FRAGMENT = re.compile(r"(AM|PM|am|pm|:|,|-)+")  # stray AM/PM pieces
 
 
 # === helpers ===
@@ -64,7 +69,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
     print("(gtb_model_01): Parsing GTBank Primelog statement...", file=sys.stderr)
     txns: List[Dict[str, str]] = []
 
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         for page_no, page in enumerate(pdf.pages, start=1):
             print(f"(gtb_model_01): Page {page_no}", file=sys.stderr)
             raw = page.extract_text() or ""
@@ -92,7 +97,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
                 if (
                     ln.endswith("-")
                     and i + 1 < len(lines)
-                    and re.match(r"^\d{4}$", lines[i + 1].strip())
+                    and RX_YEAR_LINE.match(lines[i + 1].strip())
                 ):
                     merged.append(ln + lines[i + 1].strip())
                     i += 2
@@ -195,9 +200,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
 
                         current["BALANCE"] = normalize_money(balance_raw)
                         # determine sign context for first amount
-                        if "-" in first_raw or re.search(
-                            r"\bwithdraw|debit|dr\b", ln, re.I
-                        ):
+                        if "-" in first_raw or RX_DEBIT_HINT.search(ln):
                             current["DEBIT"] = normalize_money(first_raw)
                         else:
                             current["CREDIT"] = normalize_money(first_raw)
@@ -220,9 +223,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
                         amt_raw, bal_raw = nums[0], nums[1]
                         current["BALANCE"] = normalize_money(bal_raw)
                         # choose debit vs credit by presence of minus or 'BR' 'DR' context
-                        if "-" in amt_raw or re.search(
-                            r"\bwithdraw|debit|dr\b", ln, re.I
-                        ):
+                        if "-" in amt_raw or RX_DEBIT_HINT.search(ln):
                             current["DEBIT"] = normalize_money(amt_raw)
                         else:
                             current["CREDIT"] = normalize_money(amt_raw)
@@ -231,7 +232,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
                     # remove the numeric substrings to get pure text
                     text_only = RX_AMOUNT.sub(" ", ln).strip()
                     # often the reference is at the start (e.g. "'24747419..." or "'BR"), use that
-                    text_only = re.sub(r"\s{2,}", " ", text_only).strip()
+                    text_only = RX_MULTI_SPACE.sub(" ", text_only).strip()
                     if text_only:
                         # split typical patterns: leading token as reference if short, rest as remarks
                         parts = text_only.split(" ", 1)
@@ -241,9 +242,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
                         # clean leading apostrophes in references
                         cleaned_first = first_part.lstrip("'").strip()
                         # heuristics to decide if first token is a reference (numbers/short alpha)
-                        if len(cleaned_first) <= 20 and re.search(
-                            r"[0-9A-Za-z]", cleaned_first
-                        ):
+                        if len(cleaned_first) <= 20 and RX_ALNUM.search(cleaned_first):
                             # assign as reference and append rest to remarks
                             if not current["REFERENCE"]:
                                 current["REFERENCE"] = cleaned_first
@@ -264,7 +263,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
                     continue
 
                 # ignore standalone AM/PM or very short tokens that got mis-extracted
-                if re.fullmatch(r"(AM|PM|am|pm|:|,|-)+", ln.strip()):
+                if RX_TIME_FRAGMENT.fullmatch(ln.strip()):
                     continue
 
                 # otherwise treat as narration/remarks
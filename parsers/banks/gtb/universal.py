@@ -1,5 +1,4 @@
 import sys
-import pdfplumber
 from typing import List, Dict
 from utils import (
     normalize_column_name,
@@ -7,6 +6,7 @@ from utils import (
     MAIN_TABLE_SETTINGS,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
 
@@ -15,13 +15,11 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(gtb): Processing page {page_num}", file=sys.stderr)
 
-                # Table extraction settings
-                table_settings = MAIN_TABLE_SETTINGS.copy()
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if tables:
                     for table in tables:
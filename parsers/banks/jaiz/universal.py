@@ -1,15 +1,16 @@
 # banks/jaiz/universal.py
 import sys
 import re
-import pdfplumber
 from typing import List, Dict
 
 from utils import (
     normalize_column_name,
     FIELD_MAPPINGS,
+    MAIN_TABLE_SETTINGS,
     normalize_date,
     to_float,
     calculate_checks,
+    open_pdf,
 )
 
 
@@ -53,7 +54,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             if not pdf.pages:
                 return []
 
@@ -69,18 +70,7 @@ def parse(path: str) -> List[Dict[str, str]]:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(jaiz): Processing page {page_num}", file=sys.stderr)
 
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 1,
-                }
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if not tables:
                     print(
@@ -1,6 +1,5 @@
 import sys
 import re
-import pdfplumber
 from typing import List, Dict
 
 from utils import (
@@ -14,6 +13,7 @@ from utils import (
     RX_FOUR_DIGIT_YEAR,  # <-- use your regex
     RX_ENDS_MONTH_DASH,
     RX_MULTI_WS,
+    open_pdf,
 )
 
 
@@ -128,7 +128,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(jubilee_bank): Processing page {page_num}", file=sys.stderr)
                 tables = page.extract_tables(MAIN_TABLE_SETTINGS)
@@ -1,9 +1,9 @@
 import re
 import sys
-import pdfplumber
 from typing import Callable, Optional, List, Dict
 
 from .universal import parse as parse_universal
+from utils import open_pdf
 
 # from .model_01 import parse as parse_universal
 
@@ -37,7 +37,7 @@ def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]
     Returns the matching parser function or defaults to `parse_universal`.
     """
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             if not pdf.pages:
                 return None
 
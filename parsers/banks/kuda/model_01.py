@@ -2,8 +2,6 @@ import re
 import sys
 from typing import List, Dict, Optional
 
-import pdfplumber
-
 from utils import (
     normalize_date,
     join_date_fragments,
@@ -12,6 +10,7 @@ from utils import (
     to_float,
     calculate_checks,
     RX_MULTI_WS,
+    open_pdf,
 )
 
 # Matches "12/05/25" (Kuda commonly uses dd/mm/yy)
@@ -170,7 +169,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
         current_date_raw = ""
         current_time_raw = ""
 
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages, 1):
             print(f"(kuda:model_01): Processing page {page_num}", file=sys.stderr)
 
@@ -2,8 +2,6 @@ import re
 import sys
 from typing import List, Dict, Optional, Tuple
 
-import pdfplumber
-
 from utils import (
     normalize_date,
     join_date_fragments,
@@ -11,6 +9,7 @@ from utils import (
     to_float,
     calculate_checks,
     RX_MULTI_WS,
+    open_pdf,
 )
 
 RX_DATE = re.compile(r"^\s*(\d{2}/\d{2}/\d{2})\b")
@@ -233,7 +232,7 @@ def parse(pdf_path: str) -> List[Dict[str, str]]:
         current_amounts = []
         current_balance_raw = ""
 
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages, 1):
             print(f"(kuda): Processing page {page_num}", file=sys.stderr)
 
@@ -1,7 +1,6 @@
 # /banks/lotus/universal.py
 import sys
 import re
-import pdfplumber
 from typing import List, Dict
 from utils import (
     normalize_column_name,
@@ -11,6 +10,7 @@ from utils import (
     calculate_checks,
     normalize_date,
     MAIN_TABLE_SETTINGS,
+    open_pdf,
 )
 
 
@@ -32,12 +32,11 @@ def parse(path: str) -> List[Dict[str, str]]:
     last_txn = None  # last real txn for continuation join
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(lotus): Processing page {page_num}", file=sys.stderr)
 
-                table_settings = MAIN_TABLE_SETTINGS
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
                 if not tables:
                     print("(lotus): No tables found ...", file=sys.stderr)
                     continue
@@ -2,7 +2,6 @@
 import sys
 import re
 from typing import List, Dict
-import pdfplumber
 
 from utils import (
     STANDARDIZED_ROW,
@@ -10,6 +9,7 @@ from utils import (
     clean_money,
     merge_and_drop_year_artifacts,
     calculate_checks,
+    open_pdf,
 )
 
 # --- Patterns ---------------------------------------------------------------
@@ -133,7 +133,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     transactions: List[Dict[str, str]] = []
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(moniepoint): Processing page {page_num}", file=sys.stderr)
                 raw_lines = [
@@ -1,6 +1,5 @@
 import sys
 import re
-import pdfplumber
 from typing import List, Dict
 from utils import (
     normalize_column_name,
@@ -8,6 +7,7 @@ from utils import (
     MAIN_TABLE_SETTINGS,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
 
@@ -16,13 +16,11 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(myBankStatement): Processing page {page_num}", file=sys.stderr)
 
-                # Table extraction settings
-                table_settings = MAIN_TABLE_SETTINGS.copy()
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if tables:
                     for table in tables:
@@ -1,7 +1,7 @@
 # banks/opay/universal.py
-import sys, re, pdfplumber
+import sys, re
 from typing import List, Dict, Optional
-from utils import normalize_date, normalize_money, to_float, calculate_checks
+from utils import normalize_date, normalize_money, to_float, calculate_checks, open_pdf
 
 PRIMARY = {
     "vertical_strategy": "lines",
@@ -78,6 +78,7 @@ RX_DATE = re.compile(
 RX_TIME = re.compile(r"\b\d{2}:\d{2}:\d{2}\b")
 RX_SIGNED = re.compile(r"([+-]\s*[\d,]+(?:\.\d{2})?)")
 RX_NUM = re.compile(r"(-?\s*[\d,]+(?:\.\d{2})?)")
+RX_CHANNEL_TOKEN = re.compile(r"\b(E-Channel|POS|Web|Card)\b", re.I)
 
 
 def _extract_dates_amount_balance(blob: str):
@@ -104,15 +105,15 @@ def _extract_dates_amount_balance(blob: str):
 
 def _clean_remarks(blob: str):
     # Drop common channel tokens; keep readable text
-    blob = re.sub(r"\b(E-Channel|POS|Web|Card)\b", "", blob, flags=re.I)
-    return re.sub(r"\s+", " ", blob).strip()
+    blob = RX_CHANNEL_TOKEN.sub("", blob)
+    return " ".join(blob.split())
 
 
 def parse(path: str) -> List[Dict[str, str]]:
     txns: List[Dict[str, str]] = []
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for pg, page in enumerate(pdf.pages, 1):
                 print(f"(opay): Processing page {pg}", file=sys.stderr)
                 tables = page.extract_tables(PRIMARY) or []
@@ -209,9 +210,12 @@ def parse(path: str) -> List[Dict[str, str]]:
                             )
                             continue
 
+                        # Strip each cell once here; the checks below reuse the result
                         def cell(name: str) -> str:
                             i = idx[name]
-                            return (r[i] if i is not None and i < len(r) else "") or ""
+                            return (
+                                (r[i] if i is not None and i < len(r) else "") or ""
+                            ).strip()
 
                         raw_time = cell("TXN_TIME")
                         raw_val = cell("VAL_DATE")
@@ -222,11 +226,11 @@ def parse(path: str) -> List[Dict[str, str]]:
 
                         # If row looks empty except desc → continuation; append to last remarks
                         if (
-                            not raw_time.strip()
-                            and not raw_val.strip()
-                            and not raw_amt.strip()
-                            and not raw_bal.strip()
-                            and raw_desc.strip()
+                            not raw_time
+                            and not raw_val
+                            and not raw_amt
+                            and not raw_bal
+                            and raw_desc
                             and txns
                         ):
                             prev = txns[-1]
@@ -255,13 +259,13 @@ def parse(path: str) -> List[Dict[str, str]]:
                             {
                                 "TXN_DATE": td or vd,
                                 "VAL_DATE": vd,
-                                "REFERENCE": raw_ref.strip(),
+                                "REFERENCE": raw_ref,
                                 "REMARKS": _clean_remarks(raw_desc),
                                 "DEBIT": f"{debit:.2f}",
                                 "CREDIT": f"{credit:.2f}",
                                 "BALANCE": (
                                     f"{to_float(raw_bal):.2f}"
-                                    if raw_bal.strip()
+                                    if raw_bal
                                     else (f"{bal:.2f}" if bal is not None else "")
                                 ),
                                 "Check": "",
@@ -1,6 +1,5 @@
 import re
 from typing import List, Dict
-import pdfplumber
 
 from utils import (
     MAIN_TABLE_SETTINGS,
@@ -8,8 +7,11 @@ from utils import (
     FIELD_MAPPINGS,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
+ALPHA_RE = re.compile(r"[A-Za-z]")
+
 
 # -----------------------------------------------------
 # Helper — clean invalid numeric amounts
@@ -28,7 +30,7 @@ def clean_amount(value: str) -> str:
     s = value.strip()
 
     # Reject alphanumeric junk like "Page", "Page 3"
-    if re.search(r"[A-Za-z]", s):
+    if ALPHA_RE.search(s):
         return "0.00"
 
     # Values without decimals are considered invalid for this bank
@@ -78,7 +80,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     transactions = []
     global_headers = None
 
-    with pdfplumber.open(path) as pdf:
+    with open_pdf(path) as pdf:
 
         # -------------------------------------------
         # PAGE 1 — detect the LONGEST table
@@ -1,5 +1,4 @@
 import sys
-import pdfplumber
 from typing import List, Dict
 from utils import (
     normalize_column_name,
@@ -8,6 +7,7 @@ from utils import (
     calculate_checks,
     MAIN_TABLE_SETTINGS,
     to_float,
+    open_pdf,
 )
 
 
@@ -124,7 +124,7 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
 
             # ----------------------------------------------------
             # PAGE 1 — detect headers using the longest table
@@ -5,15 +5,15 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from copy import deepcopy
 
-import pdfplumber
-
-from utils import normalize_date, to_float, parse_text_row, calculate_checks
+from utils import normalize_date, to_float, parse_text_row, calculate_checks, open_pdf
 
 # ----------------------------
 # Patterns & constants
 # ----------------------------
 DATE_TOKEN = re.compile(r"\b\d{2}[-/]\d{2}[-/]\d{4}\b")
 DATE_LINE = re.compile(r"\b\d{2}[-/]\d{2}[-/]\d{4}\b.*\b\d{2}[-/]\d{2}[-/]\d{4}\b")
+# Text-mode transaction rows start with the txn date
+TXN_START = re.compile(r"^\d{2}[-/]\d{2}[-/]\d{4}")
 AMOUNT_RE = re.compile(r"\d{1,3}(?:,\d{3})*\.\d{2}(?:\s?(?:CR|DR))?", re.IGNORECASE)
 
 FOOTER_PATTERNS = [
@@ -23,6 +23,10 @@ FOOTER_PATTERNS = [
     re.compile(r"0700\s*CALL\s*STANBIC", re.IGNORECASE),
     re.compile(r"Customer\s*Contact\s*Centre", re.IGNORECASE),
 ]
+# All footer patterns fused into one alternation: a single scan per line
+FOOTER_RE = re.compile("|".join(p.pattern for p in FOOTER_PATTERNS), re.IGNORECASE)
+CR_DR_SUFFIX_RE = re.compile(r"\s*(CR|DR)\s*$", re.IGNORECASE)
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
 
 HEADERS = ["TXN_DATE", "VAL_DATE", "REMARKS", "DEBIT", "CREDIT", "BALANCE"]
 
@@ -38,14 +42,11 @@ SKIP_REMARKS = re.compile(
 def is_footer(line: str) -> bool:
     if not line:
         return False
-    for p in FOOTER_PATTERNS:
-        if p.search(line):
-            return True
-    return False
+    return FOOTER_RE.search(line) is not None
 
 
 def strip_cr_dr(s: str) -> str:
-    return re.sub(r"\s*(CR|DR)\s*$", "", s, flags=re.IGNORECASE).strip()
+    return CR_DR_SUFFIX_RE.sub("", s).strip()
 
 
 def _parse_amount(s: Optional[str]) -> Optional[float]:
@@ -398,7 +399,7 @@ def _text_mode_parse_page(page, prev_balance: Optional[float], debug: bool = Fal
     """
     rows: List[Dict[str, str]] = []
     text = page.extract_text() or ""
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    lines = [ln for ln in map(str.strip, text.splitlines()) if ln]
     if not lines:
         return rows, prev_balance
 
@@ -423,7 +424,7 @@ def _text_mode_parse_page(page, prev_balance: Optional[float], debug: bool = Fal
         if is_footer(ln):
             continue
         # txn rows start with a date token (txn date)
-        if re.match(r"^\d{2}[-/]\d{2}[-/]\d{4}", ln):
+        if TXN_START.match(ln):
             if current:
                 blocks.append(current)
             current = [ln]
@@ -500,7 +501,7 @@ def _text_mode_parse_page(page, prev_balance: Optional[float], debug: bool = Fal
             remarks = joined
 
         # clean extra spacing
-        remarks = re.sub(r"\s{2,}", " ", remarks).strip()
+        remarks = MULTI_SPACE_RE.sub(" ", remarks).strip()
 
         row = [
             normalize_date(txn_date),
@@ -531,7 +532,7 @@ def parse(path: str, debug: bool = False) -> List[Dict[str, str]]:
     prev_balance: Optional[float] = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             # Seed Opening Balance (scan first 3 pages)
             all_lines_for_opening: List[str] = []
             for p in pdf.pages[:3]:
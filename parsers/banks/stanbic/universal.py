@@ -1,10 +1,9 @@
 # banks/stanbic/universal.py
 import sys
 import re
-import pdfplumber
 from typing import List, Dict, Optional
 
-from utils import normalize_date, to_float, parse_text_row, calculate_checks
+from utils import normalize_date, to_float, parse_text_row, calculate_checks, open_pdf
 
 # Patterns
 DATE_TOKEN = re.compile(r"\b\d{2}[-/]\d{2}[-/]\d{4}\b")
@@ -17,6 +16,9 @@ FOOTER_PATTERNS = [
     re.compile(r"stanbicibtcbank\.com", re.IGNORECASE),
     re.compile(r"0700 CALL STANBIC", re.IGNORECASE),
 ]
+# All footer patterns fused into one alternation: a single scan per line
+FOOTER_RE = re.compile("|".join(p.pattern for p in FOOTER_PATTERNS), re.IGNORECASE)
+CR_DR_SUFFIX_RE = re.compile(r"\s*(CR|DR)\s*$", re.IGNORECASE)
 
 HEADERS = ["TXN_DATE", "VAL_DATE", "REMARKS", "DEBIT", "CREDIT", "BALANCE"]
 
@@ -24,14 +26,11 @@ HEADERS = ["TXN_DATE", "VAL_DATE", "REMARKS", "DEBIT", "CREDIT", "BALANCE"]
 def is_footer(line: str) -> bool:
     if not line:
         return False
-    for p in FOOTER_PATTERNS:
-        if p.search(line):
-            return True
-    return False
+    return FOOTER_RE.search(line) is not None
 
 
 def strip_cr_dr(s: str) -> str:
-    return re.sub(r"\s*(CR|DR)\s*$", "", s, flags=re.IGNORECASE).strip()
+    return CR_DR_SUFFIX_RE.sub("", s).strip()
 
 
 def find_opening_balance_from_lines(lines: List[str]) -> Optional[float]:
@@ -152,7 +151,7 @@ def parse(path: str, debug: bool = False) -> List[Dict[str, str]]:
     prev_balance: Optional[float] = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             # Pre-scan entire document for Opening Balance (safe seed for prev_balance)
             all_lines_for_opening: List[str] = []
             for p in pdf.pages[
@@ -1,16 +1,17 @@
 import sys
-import re
-import pdfplumber
 from typing import List, Dict
 
 from utils import (
     normalize_column_name,
     FIELD_MAPPINGS,
+    MAIN_TABLE_SETTINGS,
     normalize_date,
     to_float,
     normalize_money,
     parse_text_row,
     calculate_checks,
+    open_pdf,
+    RX_DATE_LINE,
 )
 
 
@@ -20,22 +21,10 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_header_map = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 print(f"(sterling): Processing page {page_num}", file=sys.stderr)
-                # Table extraction settings
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 1,
-                }
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if tables:
                     for table in tables:
@@ -97,10 +86,8 @@ def parse(path: str) -> List[Dict[str, str]]:
                             if len(row) < len(global_headers):
                                 row.extend([""] * (len(global_headers) - len(row)))
 
-                            row_dict = {
-                                global_headers[i]: row[i] if i < len(row) else ""
-                                for i in range(len(global_headers))
-                            }
+                            # Short rows were padded above, so zip pairs every column
+                            row_dict = dict(zip(global_headers, row))
 
                             standardized_row = {
                                 "TXN_DATE": normalize_date(
@@ -163,7 +150,7 @@ def parse(path: str) -> List[Dict[str, str]]:
                         lines = text.split("\n")
                         current_row = []
                         for line in lines:
-                            if re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line):
+                            if RX_DATE_LINE.match(line):
                                 if current_row:
                                     transactions.append(
                                         parse_text_row(current_row, global_headers)
@@ -1,6 +1,7 @@
-import sys
+import logging
 import re
-import pdfplumber
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict
 
 from utils import (
@@ -10,19 +11,101 @@ from utils import (
     to_float,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
+logger = logging.getLogger(__name__)
+
+# Header cells repeat on every page; cache the alias lookup per distinct cell
+_normalize_column_name = lru_cache(maxsize=128)(normalize_column_name)
+
+_RE_INT = re.compile(r"^\d+$")
+_RE_DECIMAL = re.compile(r"^\d[\d,]*\.\d{2}$")
+_RE_NUMBER = re.compile(r"\d[\d,]*\.?\d*")
+
+
+def _fix_double_entry(row: Dict[str, str], prev_balance: float) -> None:
+    """
+    Fixes false double-entry rows (both DEBIT and CREDIT set) by comparing balance movement.
+    """
+    # Most rows only populate one side; skip the float parsing for those
+    if prev_balance is None or row["DEBIT"] == "0.00" or row["CREDIT"] == "0.00":
+        return
+
+    try:
+        # current_balance may be empty or malformed; to_float returns float or None
+        current_balance = None
+        bal_raw = row.get("BALANCE", "")
+        if bal_raw:
+            # Use to_float for robust parsing (handles commas and blanks)
+            current_balance = to_float(bal_raw)
+
+        # Parse debit/credit values to floats (safe fallback to 0.0)
+        try:
+            debit_val = float(row["DEBIT"].replace(",", "")) if row["DEBIT"] else 0.0
+        except Exception:
+            debit_val = 0.0
+        try:
+            credit_val = float(row["CREDIT"].replace(",", "")) if row["CREDIT"] else 0.0
+        except Exception:
+            credit_val = 0.0
+
+        # If both debit & credit are > 0, and we know prev_balance, decide which one is wrong
+        if (
+            debit_val > 0
+            and credit_val > 0
+            and prev_balance is not None
+            and current_balance is not None
+        ):
+            if current_balance > prev_balance:
+                # Balance increased → CREDIT transaction; clear DEBIT
+                row["DEBIT"] = "0.00"
+            elif current_balance < prev_balance:
+                # Balance decreased → DEBIT transaction; clear CREDIT
+                row["CREDIT"] = "0.00"
+            # if equal, ambiguous — keep as-is (or we could clear smaller amount; opted to keep)
+    except Exception:
+        # never fail the cleaner; leave row as-is if something unexpected happens
+        pass
+
+
+def _is_date_line(line: str) -> bool:
+    r"""Cheap equivalent of re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line)."""
+    return (
+        len(line) >= 10
+        and line[0:2].isdecimal()
+        and line[2] in "-/."
+        and line[3:5].isdecimal()
+        and line[5] in "-/."
+        and line[6:10].isdecimal()
+    )
+
 
 def clean_transaction(row: Dict[str, str], prev_balance: float) -> Dict[str, str]:
     """
     Fix misaligned UBA_parser_001 rows where narration fragments spill into DEBIT, CREDIT, or REFERENCE.
     Also fixes false double-entry rows by comparing balance movement.
     """
+    ref = row.get("REFERENCE", "")
+    debit = (row.get("DEBIT") or "").strip()
+    credit = (row.get("CREDIT") or "").strip()
+
+    # Fast path: amounts are already decimals and the reference is numeric,
+    # so only the balance-based double-entry fix can still apply
+    if (
+        (not debit or _RE_DECIMAL.match(debit))
+        and (not credit or _RE_DECIMAL.match(credit))
+        and (not ref or _RE_INT.match(ref.strip()))
+    ):
+        row["DEBIT"] = debit or "0.00"
+        row["CREDIT"] = credit or "0.00"
+        _fix_double_entry(row, prev_balance)
+        return row
+
     remarks_extra = []
 
     # --- Clean REFERENCE ---
-    ref = row.get("REFERENCE", "")
-    if ref and not re.match(r"^\d+$", ref.strip()):  # not purely numeric
+    if ref and not _RE_INT.match(ref.strip()):  # not purely numeric
         remarks_extra.append(ref)
         row["REFERENCE"] = ""
 
@@ -30,21 +113,18 @@ def clean_transaction(row: Dict[str, str], prev_balance: float) -> Dict[str, str
     def is_decimal_number(value: str) -> bool:
         if not isinstance(value, str):
             return False
-        return bool(re.match(r"^\d[\d,]*\.\d{2}$", value.strip()))
+        return bool(_RE_DECIMAL.match(value.strip()))
 
     # --- Clean DEBIT ---
-    debit = (row.get("DEBIT") or "").strip()
-    credit = (row.get("CREDIT") or "").strip()
-
     if debit:
         if is_decimal_number(debit):
             row["DEBIT"] = debit
         else:
-            if re.match(r"^\d+$", debit) and is_decimal_number(credit):
+            if _RE_INT.match(debit) and is_decimal_number(credit):
                 remarks_extra.append(debit)
                 row["DEBIT"] = "0.00"
             else:
-                numbers = re.findall(r"\d[\d,]*\.?\d*", debit)
+                numbers = _RE_NUMBER.findall(debit)
                 if numbers and is_decimal_number(numbers[-1]):
                     row["DEBIT"] = numbers[-1]
                     junk = debit.replace(numbers[-1], "").strip()
@@ -61,11 +141,11 @@ def clean_transaction(row: Dict[str, str], prev_balance: float) -> Dict[str, str
         if is_decimal_number(credit):
             row["CREDIT"] = credit
         else:
-            if re.match(r"^\d+$", credit) and is_decimal_number(debit):
+            if _RE_INT.match(credit) and is_decimal_number(debit):
                 remarks_extra.append(credit)
                 row["CREDIT"] = "0.00"
             else:
-                numbers = re.findall(r"\d[\d,]*\.?\d*", credit)
+                numbers = _RE_NUMBER.findall(credit)
                 if numbers and is_decimal_number(numbers[-1]):
                     row["CREDIT"] = numbers[-1]
                     junk = credit.replace(numbers[-1], "").strip()
@@ -78,41 +158,7 @@ def clean_transaction(row: Dict[str, str], prev_balance: float) -> Dict[str, str
         row["CREDIT"] = "0.00"
 
     # --- Intelligent Balance-Based Fix ---
-    try:
-        # current_balance may be empty or malformed; to_float returns float or None
-        current_balance = None
-        bal_raw = row.get("BALANCE", "")
-        if bal_raw:
-            # Use to_float for robust parsing (handles commas and blanks)
-            current_balance = to_float(bal_raw)
-
-        # Parse debit/credit values to floats (safe fallback to 0.0)
-        try:
-            debit_val = float(row["DEBIT"].replace(",", "")) if row["DEBIT"] else 0.0
-        except Exception:
-            debit_val = 0.0
-        try:
-            credit_val = float(row["CREDIT"].replace(",", "")) if row["CREDIT"] else 0.0
-        except Exception:
-            credit_val = 0.0
-
-        # If both debit & credit are > 0, and we know prev_balance, decide which one is wrong
-        if (
-            debit_val > 0
-            and credit_val > 0
-            and prev_balance is not None
-            and current_balance is not None
-        ):
-            if current_balance > prev_balance:
-                # Balance increased → CREDIT transaction; clear DEBIT
-                row["DEBIT"] = "0.00"
-            elif current_balance < prev_balance:
-                # Balance decreased → DEBIT transaction; clear CREDIT
-                row["CREDIT"] = "0.00"
-            # if equal, ambiguous — keep as-is (or we could clear smaller amount; opted to keep)
-    except Exception:
-        # never fail the cleaner; leave row as-is if something unexpected happens
-        pass
+    _fix_double_entry(row, prev_balance)
 
     # Merge extras into remarks
     if remarks_extra:
@@ -129,33 +175,25 @@ def parse(path: str) -> List[Dict[str, str]]:
     prev_balance = None  # persist across the whole document
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
-                print(f"(uba_parser_001): Processing page {page_num}", file=sys.stderr)
-                # Table extraction settings (from MAIN_TABLE_SETTINGS)
-                table_settings = MAIN_TABLE_SETTINGS.copy()
-                tables = page.extract_tables(table_settings) or []
+                logger.debug("(uba_parser_001): Processing page %d", page_num)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS) or []
 
                 # Skip first table on page 1 if there are multiple (Account Summary)
                 if page_num == 1 and len(tables) >= 2:
-                    print(
-                        f"(uba_parser_001): Skipping first table on page 1",
-                        file=sys.stderr,
-                    )
+                    logger.debug("(uba_parser_001): Skipping first table on page 1")
                     tables = tables[1:]
 
                 if not tables:
-                    print(
-                        f"(uba_parser_001): No tables found on page {page_num}",
-                        file=sys.stderr,
-                    )
+                    logger.debug("(uba_parser_001): No tables found on page %d", page_num)
                     # If headers already known, try text fallback for that page
                     if global_headers:
                         text = page.extract_text() or ""
-                        lines = text.split("\n")
+                        lines = text.splitlines()
                         current_row = []
                         for line in lines:
-                            if re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line):
+                            if _is_date_line(line):
                                 if current_row:
                                     standardized_row = parse_text_row(
                                         current_row, global_headers
@@ -170,7 +208,11 @@ def parse(path: str) -> List[Dict[str, str]]:
                                     standardized_row = clean_transaction(
                                         standardized_row, prev_balance
                                     )
-                                    transactions.append(standardized_row)
+                                    if (
+                                        standardized_row["TXN_DATE"]
+                                        or standardized_row["VAL_DATE"]
+                                    ):
+                                        transactions.append(standardized_row)
                                     if current_balance is not None:
                                         prev_balance = current_balance
                                 current_row = [line]
@@ -188,7 +230,11 @@ def parse(path: str) -> List[Dict[str, str]]:
                             standardized_row = clean_transaction(
                                 standardized_row, prev_balance
                             )
-                            transactions.append(standardized_row)
+                            if (
+                                standardized_row["TXN_DATE"]
+                                or standardized_row["VAL_DATE"]
+                            ):
+                                transactions.append(standardized_row)
                             if current_balance is not None:
                                 prev_balance = current_balance
                     continue
@@ -200,7 +246,7 @@ def parse(path: str) -> List[Dict[str, str]]:
 
                     first_row = table[0]
                     normalized_first_row = [
-                        normalize_column_name(h) if h else "" for h in first_row
+                        _normalize_column_name(h) if h else "" for h in first_row
                     ]
                     is_header_row = any(
                         h in FIELD_MAPPINGS for h in normalized_first_row if h
@@ -208,18 +254,12 @@ def parse(path: str) -> List[Dict[str, str]]:
 
                     if is_header_row and not global_headers:
                         global_headers = normalized_first_row
-                        print(
-                            f"Stored global headers: {global_headers}", file=sys.stderr
-                        )
-                        data_rows = table[1:]
+                        logger.debug("Stored global headers: %s", global_headers)
+                        data_rows = islice(table, 1, None)
                     elif is_header_row and global_headers:
                         if normalized_first_row == global_headers:
-                            # If header repeated but table has data rows, drop header row and use remainder
-                            if len(table) > 1:
-                                data_rows = table[1:]
-                            else:
-                                # header-only table (no rows), skip
-                                data_rows = []
+                            # Repeated header: drop it and use the remainder (empty for header-only tables)
+                            data_rows = islice(table, 1, None)
                         else:
                             # different header layout - treat entire table as data (best-effort)
                             data_rows = table
@@ -228,9 +268,10 @@ def parse(path: str) -> List[Dict[str, str]]:
 
                     if not global_headers:
                         # no headers determined yet; skip this table (we can't map columns)
-                        print(
-                            f"(uba_parser_001): No headers found on page {page_num}, table {table_idx}, skipping",
-                            file=sys.stderr,
+                        logger.debug(
+                            "(uba_parser_001): No headers found on page %d, table %d, skipping",
+                            page_num,
+                            table_idx,
                         )
                         continue
 
@@ -259,16 +300,14 @@ def parse(path: str) -> List[Dict[str, str]]:
                         )
 
                         # Append and then update prev_balance from current_balance (if present)
-                        transactions.append(standardized_row)
+                        if standardized_row["TXN_DATE"] or standardized_row["VAL_DATE"]:
+                            transactions.append(standardized_row)
                         if current_balance is not None:
                             prev_balance = current_balance
 
-            # final filter & checks
-            cleaned = [
-                t for t in transactions if t.get("TXN_DATE") or t.get("VAL_DATE")
-            ]
-            return calculate_checks(cleaned)
+            # Undated rows were already dropped at append time
+            return calculate_checks(transactions)
 
     except Exception as e:
-        print(f"Error processing UBA variant statement: {e}", file=sys.stderr)
+        logger.error("Error processing UBA variant statement: %s", e)
         return []
@@ -1,12 +1,15 @@
+import logging
 import re
-import sys
 import pdfplumber
 from typing import List, Dict, Optional
 
 from utils import normalize_date, calculate_checks
 
+logger = logging.getLogger(__name__)
+
 ROW_START_RE = re.compile(r"^(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})\b")
 MONEY_TOKEN_RE = re.compile(r"-?\d[\d,]*\.\d{2}")
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
 
 
 def _money_to_str(x: Optional[float]) -> str:
@@ -31,14 +34,14 @@ def _chars_to_lines(chars, y_tol=2.0, space_gap=1.8):
     out = []
     for ln in lines:
         cs = sorted(ln["chars"], key=lambda c: c["x0"])
-        text = ""
+        parts = []
         prev_x1 = None
         for c in cs:
             if prev_x1 is not None and (c["x0"] - prev_x1) > space_gap:
-                text += " "
-            text += c["text"]
+                parts.append(" ")
+            parts.append(c["text"])
             prev_x1 = c["x1"]
-        out.append({"top": ln["top"], "text": text.strip(), "chars": cs})
+        out.append({"top": ln["top"], "text": "".join(parts).strip(), "chars": cs})
     return out
 
 
@@ -64,7 +67,7 @@ def _extract_amount_groups(line_chars):
     out = []
     for g in groups:
         txt = "".join(c["text"] for c in g).strip()
-        if re.fullmatch(r"-?\d[\d,]*\.\d{2}", txt):
+        if MONEY_TOKEN_RE.fullmatch(txt):
             out.append(
                 {
                     "text": txt,
@@ -113,7 +116,7 @@ def _remove_extracted_money_from_remarks(
     cleaned = "".join(parts)
 
     # normalize whitespace
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    cleaned = MULTI_SPACE_RE.sub(" ", cleaned).strip()
     return cleaned
 
 
@@ -129,7 +132,7 @@ def parse(
     with pdfplumber.open(pdf_path, password=password) as pdf:
         for pno, page in enumerate(pdf.pages, 1):
             # for page in pdf.pages:
-            print(f"(uba:model_02) page {pno}", file=sys.stderr)
+            logger.debug("(uba:model_02) page %d", pno)
 
             lines = _chars_to_lines(page.chars)
 
@@ -1,15 +1,39 @@
-import sys
+import logging
 import re
-import pdfplumber
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict
 
 from utils import (
     normalize_column_name,
     FIELD_MAPPINGS,
+    MAIN_TABLE_SETTINGS,
     parse_text_row,
     calculate_checks,
+    open_pdf,
 )
 
+logger = logging.getLogger(__name__)
+
+# Header cells repeat on every page; cache the alias lookup per distinct cell
+_normalize_column_name = lru_cache(maxsize=128)(normalize_column_name)
+
+_RE_INT = re.compile(r"^\d+$")
+_RE_DECIMAL = re.compile(r"^\d[\d,]*\.\d{2}$")
+_RE_NUMBER = re.compile(r"\d[\d,]*\.?\d*")
+
+
+def _is_date_line(line: str) -> bool:
+    r"""Cheap equivalent of re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line)."""
+    return (
+        len(line) >= 10
+        and line[0:2].isdecimal()
+        and line[2] in "-/."
+        and line[3:5].isdecimal()
+        and line[5] in "-/."
+        and line[6:10].isdecimal()
+    )
+
 
 def clean_transaction(row: Dict[str, str]) -> Dict[str, str]:
     """
@@ -20,33 +44,43 @@ def clean_transaction(row: Dict[str, str]) -> Dict[str, str]:
       treat the integer as junk and move it to REMARKS.
     - Ensure empty DEBIT/CREDIT are formatted as "0.00".
     """
+    ref = row.get("REFERENCE", "")
+    debit = row.get("DEBIT", "").strip()
+    credit = row.get("CREDIT", "").strip()
+
+    # Fast path: amounts are already decimals and the reference is numeric
+    if (
+        (not debit or _RE_DECIMAL.match(debit))
+        and (not credit or _RE_DECIMAL.match(credit))
+        and (not ref or _RE_INT.match(ref.strip()))
+    ):
+        row["DEBIT"] = debit or "0.00"
+        row["CREDIT"] = credit or "0.00"
+        return row
+
     remarks_extra = []
 
     # --- Clean REFERENCE ---
-    ref = row.get("REFERENCE", "")
-    if ref and not re.match(r"^\d+$", ref.strip()):  # not purely numeric
+    if ref and not _RE_INT.match(ref.strip()):  # not purely numeric
         remarks_extra.append(ref)
         row["REFERENCE"] = ""
 
     # Helper to check if a string looks like a money value with decimals
     def is_decimal_number(value: str) -> bool:
-        return bool(re.match(r"^\d[\d,]*\.\d{2}$", value.strip()))
+        return bool(_RE_DECIMAL.match(value.strip()))
 
     # --- Clean DEBIT ---
-    debit = row.get("DEBIT", "").strip()
-    credit = row.get("CREDIT", "").strip()
-
     if debit:
         if is_decimal_number(debit):
             row["DEBIT"] = debit
         else:
             # if it's a plain integer and credit has a valid decimal → junk
-            if re.match(r"^\d+$", debit) and is_decimal_number(credit):
+            if _RE_INT.match(debit) and is_decimal_number(credit):
                 remarks_extra.append(debit)
                 row["DEBIT"] = "0.00"
             else:
                 # fallback: try to extract last valid decimal
-                numbers = re.findall(r"\d[\d,]*\.?\d*", debit)
+                numbers = _RE_NUMBER.findall(debit)
                 if numbers and is_decimal_number(numbers[-1]):
                     row["DEBIT"] = numbers[-1]
                     junk = debit.replace(numbers[-1], "").strip()
@@ -64,11 +98,11 @@ def clean_transaction(row: Dict[str, str]) -> Dict[str, str]:
             row["CREDIT"] = credit
         else:
             # if it's a plain integer and debit has a valid decimal → junk
-            if re.match(r"^\d+$", credit) and is_decimal_number(debit):
+            if _RE_INT.match(credit) and is_decimal_number(debit):
                 remarks_extra.append(credit)
                 row["CREDIT"] = "0.00"
             else:
-                numbers = re.findall(r"\d[\d,]*\.?\d*", credit)
+                numbers = _RE_NUMBER.findall(credit)
                 if numbers and is_decimal_number(numbers[-1]):
                     row["CREDIT"] = numbers[-1]
                     junk = credit.replace(numbers[-1], "").strip()
@@ -95,22 +129,10 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_header_map = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
-                print(f"(uba): Processing page {page_num}", file=sys.stderr)
-                # Table extraction settings
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 1,
-                }
-                tables = page.extract_tables(table_settings)
+                logger.debug("(uba): Processing page %d", page_num)
+                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
 
                 if tables:
                     for table in tables:
@@ -119,7 +141,7 @@ def parse(path: str) -> List[Dict[str, str]]:
 
                         first_row = table[0]
                         normalized_first_row = [
-                            normalize_column_name(h) if h else "" for h in first_row
+                            _normalize_column_name(h) if h else "" for h in first_row
                         ]
                         is_header_row = any(
                             h in FIELD_MAPPINGS for h in normalized_first_row if h
@@ -132,31 +154,27 @@ def parse(path: str) -> List[Dict[str, str]]:
                                 for i, h in enumerate(global_headers)
                                 if h in FIELD_MAPPINGS
                             }
-                            print(
-                                f"Stored global headers: {global_headers}",
-                                file=sys.stderr,
-                            )
-                            data_rows = table[1:]
+                            logger.debug("Stored global headers: %s", global_headers)
+                            data_rows = islice(table, 1, None)
                         elif is_header_row and global_headers:
                             if normalized_first_row == global_headers:
-                                print(
-                                    f"Skipping repeated header row on page {page_num}",
-                                    file=sys.stderr,
+                                logger.debug(
+                                    "Skipping repeated header row on page %d", page_num
                                 )
-                                data_rows = table[1:]
+                                data_rows = islice(table, 1, None)
                             else:
-                                print(
-                                    f"Different headers on page {page_num}, treating as data",
-                                    file=sys.stderr,
+                                logger.debug(
+                                    "Different headers on page %d, treating as data",
+                                    page_num,
                                 )
                                 data_rows = table
                         else:
                             data_rows = table
 
                         if not global_headers:
-                            print(
-                                f"(uba): No headers found by page {page_num}, skipping table",
-                                file=sys.stderr,
+                            logger.debug(
+                                "(uba): No headers found by page %d, skipping table",
+                                page_num,
                             )
                             continue
 
@@ -168,16 +186,16 @@ def parse(path: str) -> List[Dict[str, str]]:
 
                             transactions.append(standardized_row)
                 else:
-                    print(
-                        f"(uba): No tables found on page {page_num}, attempting text extraction",
-                        file=sys.stderr,
+                    logger.debug(
+                        "(uba): No tables found on page %d, attempting text extraction",
+                        page_num,
                     )
                     text = page.extract_text()
                     if text and global_headers:
-                        lines = text.split("\n")
+                        lines = text.splitlines()
                         current_row = []
                         for line in lines:
-                            if re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line):
+                            if _is_date_line(line):
                                 if current_row:
                                     transactions.append(
                                         parse_text_row(current_row, global_headers)
@@ -195,5 +213,5 @@ def parse(path: str) -> List[Dict[str, str]]:
         )
 
     except Exception as e:
-        print(f"Error processing UBA statement: {e}", file=sys.stderr)
+        logger.error("Error processing UBA statement: %s", e)
         return []
@@ -1,9 +1,11 @@
-import pdfplumber
+import logging
 import re
-import sys
 from typing import Callable, Optional, List, Dict
 from .universal import parse as parse_universal
 from .model_01 import parse as parse_model_01
+from utils import open_pdf
+
+logger = logging.getLogger(__name__)
 
 # Map variant keys directly to their parser functions
 PARSER_MAP: Dict[str, Callable[[str], List[Dict[str, str]]]] = {
@@ -28,7 +30,7 @@ def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]
     Returns the appropriate parser function.
     """
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             if not pdf.pages:
                 return None
 
@@ -43,19 +45,15 @@ def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]
                     or (isinstance(p, re.Pattern) and p.search(text_lower))
                     for p in patterns
                 ):
-                    print(
-                        f"(wema_detector): Detected WEMA variant: {variant}",
-                        file=sys.stderr,
-                    )
+                    logger.debug("(wema_detector): Detected WEMA variant: %s", variant)
                     return PARSER_MAP.get(variant, parse_universal)
 
             # Default fallback if no match is found
-            print(
-                "(wema_detector): No specific variant detected, using universal parser",
-                file=sys.stderr,
+            logger.debug(
+                "(wema_detector): No specific variant detected, using universal parser"
             )
             return parse_universal
 
     except Exception as e:
-        print(f"(wema_detector): Error during detection: {e}", file=sys.stderr)
+        logger.error("(wema_detector): Error during detection: %s", e)
         return parse_universal
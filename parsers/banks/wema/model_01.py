@@ -1,98 +1,127 @@
-import sys
-import pdfplumber
-from typing import List, Dict
+import logging
+from functools import lru_cache
+from pdfplumber.table import TableSettings
+from typing import List, Dict, Optional
 from utils import (
     normalize_column_name,
     FIELD_MAPPINGS,
     MAIN_TABLE_SETTINGS,
     parse_text_row,
     calculate_checks,
+    open_pdf,
+    page_run_workers,
+    map_page_runs,
 )
 
+logger = logging.getLogger(__name__)
+
+# Header cells repeat on every page; cache the alias lookup per distinct cell
+_normalize_column_name = lru_cache(maxsize=128)(normalize_column_name)
+
+# Resolved once; the text settings are reused when extracting the kept tables
+TABLE_SETTINGS = TableSettings.resolve(MAIN_TABLE_SETTINGS)
+TEXT_SETTINGS = TABLE_SETTINGS.text_settings or {}
+
+
+def _page_tables(page, page_num: int) -> Optional[List[List[List[str]]]]:
+    """
+    Extract the transaction tables from one page, dropping the leading summary table.
+    Returns None for summary-only pages.
+    """
+    logger.debug("(wema/model_1): Processing page %d", page_num)
+
+    # Locate tables by ruling lines only; cell text is read just for the tables we keep
+    found = page.find_tables(TABLE_SETTINGS)
+
+    # ⚠️ Skip the first table on each page (summary table)
+    if len(found) > 1:
+        tables = [table.extract(**TEXT_SETTINGS) for table in found[1:]]
+        # Tables are plain lists; release the page's cached layout objects
+        page.close()
+        logger.debug("(wema/model_1): Skipped summary table on page %d", page_num)
+        return tables
+
+    page.close()
+
+    logger.debug(
+        "(wema/model_1): Only one table on page %d, skipping (summary only)", page_num
+    )
+    return None
+
 
 def parse(path: str) -> List[Dict[str, str]]:
     transactions = []
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                print(f"(wema/model_1): Processing page {page_num}", file=sys.stderr)
-
-                # Table extraction settings
-                tables = page.extract_tables(MAIN_TABLE_SETTINGS)
-
-                # ⚠️ Skip the first table on each page (summary table)
-                if len(tables) > 1:
-                    tables = tables[1:]
-                    print(
-                        f"(wema/model_1): Skipped summary table on page {page_num}",
-                        file=sys.stderr,
-                    )
-                else:
-                    print(
-                        f"(wema/model_1): Only one table on page {page_num}, skipping (summary only)",
-                        file=sys.stderr,
+        with open_pdf(path) as pdf:
+            page_count = len(pdf.pages)
+            parallel = page_run_workers(page_count) > 1
+            if not parallel:
+                page_tables = [
+                    _page_tables(page, page_num)
+                    for page_num, page in enumerate(pdf.pages, 1)
+                ]
+
+        if parallel:
+            # Table extraction is independent per page; the header handling below
+            # still runs in page order
+            page_tables = map_page_runs(path, page_count, _page_tables)
+
+        for page_num, tables in enumerate(page_tables, 1):
+            if tables is None:
+                continue
+
+            if tables:
+                for table in tables:
+                    if not table or len(table) < 1:
+                        continue
+
+                    first_row = table[0]
+                    normalized_first_row = [
+                        _normalize_column_name(h) if h else "" for h in first_row
+                    ]
+                    is_header_row = any(
+                        h in FIELD_MAPPINGS for h in normalized_first_row if h
                     )
-                    continue
-
-                if tables:
-                    for table in tables:
-                        if not table or len(table) < 1:
-                            continue
-
-                        first_row = table[0]
-                        normalized_first_row = [
-                            normalize_column_name(h) if h else "" for h in first_row
-                        ]
-                        is_header_row = any(
-                            h in FIELD_MAPPINGS for h in normalized_first_row if h
-                        )
 
-                        if is_header_row and not global_headers:
-                            global_headers = normalized_first_row
+                    if is_header_row and not global_headers:
+                        global_headers = normalized_first_row
 
-                            print(
-                                f"Stored global headers: {global_headers}",
-                                file=sys.stderr,
+                        logger.debug("Stored global headers: %s", global_headers)
+                        data_rows = table[1:]
+                    elif is_header_row and global_headers:
+                        if normalized_first_row == global_headers:
+                            logger.debug(
+                                "Skipping repeated header row on page %d", page_num
                             )
                             data_rows = table[1:]
-                        elif is_header_row and global_headers:
-                            if normalized_first_row == global_headers:
-                                print(
-                                    f"Skipping repeated header row on page {page_num}",
-                                    file=sys.stderr,
-                                )
-                                data_rows = table[1:]
-                            else:
-                                print(
-                                    f"Different headers on page {page_num}, treating as data",
-                                    file=sys.stderr,
-                                )
-                                data_rows = table
                         else:
+                            logger.debug(
+                                "Different headers on page %d, treating as data",
+                                page_num,
+                            )
                             data_rows = table
+                    else:
+                        data_rows = table
 
-                        if not global_headers:
-                            print(
-                                f"(wema/model_1): No headers found by page {page_num}, skipping table",
-                                file=sys.stderr,
-                            )
-                            continue
+                    if not global_headers:
+                        logger.debug(
+                            "(wema/model_1): No headers found by page %d, skipping table",
+                            page_num,
+                        )
+                        continue
 
-                        for row in data_rows:
-                            standardized_row = parse_text_row(row, global_headers)
+                    for row in data_rows:
+                        standardized_row = parse_text_row(row, global_headers)
+                        # Keep only dated rows here rather than filtering the list afterwards
+                        if standardized_row["TXN_DATE"] or standardized_row["VAL_DATE"]:
                             transactions.append(standardized_row)
-                else:
-                    print(
-                        f"(wema/model_1): No tables found on page {page_num}",
-                        file=sys.stderr,
-                    )
+            else:
+                logger.debug("(wema/model_1): No tables found on page %d", page_num)
 
-        return calculate_checks(
-            [t for t in transactions if t["TXN_DATE"] or t["VAL_DATE"]]
-        )
+        return calculate_checks(transactions)
 
     except Exception as e:
-        print(f"Error processing WEMA Bank statement: {e}", file=sys.stderr)
+        logger.error("Error processing WEMA Bank statement: %s", e)
         return []
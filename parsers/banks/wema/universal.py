@@ -1,10 +1,11 @@
 # banks/wema/universal.py
-import sys
+import logging
 import re
-import pdfplumber
 from typing import List, Dict, Optional, Tuple
 
-from utils import normalize_date, to_float, calculate_checks, STANDARDIZED_ROW
+from utils import normalize_date, to_float, calculate_checks, STANDARDIZED_ROW, open_pdf
+
+logger = logging.getLogger(__name__)
 
 # --- Month pattern: only real months (prevents matching words like "salary") ---
 MONTH_PATTERN = r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
@@ -18,6 +19,17 @@ DATE_START_RE = re.compile(rf"^\s*(\d{{1,2}})[-/ ]*({MONTH_PATTERN})\b", re.I)
 YEAR_RE = re.compile(r"\b(20\d{2}|19\d{2}|\d{2})\b")
 MONEY_RE = re.compile(r"[\d,]+\.\d{2}")
 REF_RE = re.compile(r"\b([A-Za-z]\d{3,})\b", re.I)
+# Searched over the whole page text, so the gap must not cross a line break
+OPENING_BALANCE_RE = re.compile(r"Opening Balance[^\S\n]+([\d,]+\.\d{2})")
+TRAILING_YEAR_RE = re.compile(r"^\s*(20\d{2}|19\d{2}|\d{2})\b")
+YEAR4_RE = re.compile(r"\b(20\d{2}|19\d{2})\b")
+YEAR2_RE = re.compile(r"\b(\d{2})\b")
+STANDALONE_YEAR_RE = re.compile(r"\b20\d{2}\b")
+
+
+def _is_date_start(s: str) -> bool:
+    """DATE_START_RE.match for an already-stripped line, rejecting lines without a leading digit first."""
+    return s[:1].isdigit() and DATE_START_RE.match(s) is not None
 
 
 def parse(path: str) -> List[Dict[str, str]]:
@@ -27,44 +39,47 @@ def parse(path: str) -> List[Dict[str, str]]:
     current_row_lines: Optional[List[str]] = None
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, start=1):
-                print(f"(wema): Processing page {page_num}", file=sys.stderr)
+                logger.debug("(wema): Processing page %d", page_num)
                 text = page.extract_text()
+                # Only the text is needed from here on; drop the page's cached layout objects
+                page.close()
                 if not text:
-                    print(f"(wema): No text on page {page_num}", file=sys.stderr)
+                    logger.debug("(wema): No text on page %d", page_num)
                     continue
 
-                # Normalize Naira symbol and split into lines
-                lines = [ln.replace("\u20a6", "₦") for ln in text.split("\n")]
+                # Split into lines
+                lines = text.split("\n")
 
                 # --- Extract Opening Balance (page 1) if present ---
-                if page_num == 1 and opening_balance is None:
-                    for ln in lines:
-                        if "Opening Balance" in ln:
-                            match = re.search(r"Opening Balance\s+([\d,]+\.\d{2})", ln)
-                            if match:
-                                opening_balance = to_float(match.group(1))
-                                prev_balance = opening_balance
-                                print(
-                                    f"(wema): Found Opening Balance = {opening_balance}",
-                                    file=sys.stderr,
-                                )
-                                break
+                if (
+                    page_num == 1
+                    and opening_balance is None
+                    and "Opening Balance" in text
+                ):
+                    match = OPENING_BALANCE_RE.search(text)
+                    if match:
+                        opening_balance = to_float(match.group(1))
+                        prev_balance = opening_balance
+                        logger.debug(
+                            "(wema): Found Opening Balance = %s", opening_balance
+                        )
 
                 # --- Find the transaction header block on this page ---
                 header_idx = None
-                for i, ln in enumerate(lines):
-                    low = ln.lower()
-                    if "transaction details" in low and "balance" in low:
-                        header_idx = i
-                        break
+                # Lower-case the page once; only walk the lines if a header can be on it
+                if "transaction details" in text.lower():
+                    for i, ln in enumerate(lines):
+                        low = ln.lower()
+                        if "transaction details" in low and "balance" in low:
+                            header_idx = i
+                            break
 
                 # Strict page-1 guard: skip page 1 until header appears
                 if page_num == 1 and header_idx is None:
-                    print(
-                        "(wema): page 1 header not found yet — skipping front matter",
-                        file=sys.stderr,
+                    logger.debug(
+                        "(wema): page 1 header not found yet — skipping front matter"
                     )
                     continue
 
@@ -72,38 +87,39 @@ def parse(path: str) -> List[Dict[str, str]]:
                 if header_idx is not None:
                     start_idx = None
                     for k in range(header_idx + 1, len(lines)):
-                        if DATE_START_RE.match(lines[k].strip()):
+                        if _is_date_start(lines[k].strip()):
                             start_idx = k
                             break
                     if start_idx is None:
-                        print(
-                            f"(wema): header found on page {page_num} but no date-line after it; skipping page",
-                            file=sys.stderr,
+                        logger.debug(
+                            "(wema): header found on page %d but no date-line after it; skipping page",
+                            page_num,
                         )
                         continue
                 else:
                     start_idx = 0
 
                 # --- Build transaction buffers from lines[start_idx:] ---
-                for ln in lines[start_idx:]:
-                    ln_stripped = ln.strip()
-                    if not ln_stripped:
-                        continue
-
-                    if DATE_START_RE.match(ln_stripped):
-                        # finalize previous buffer
-                        if current_row_lines:
-                            txn = _build_transaction(current_row_lines, prev_balance)
-                            if txn:
-                                prev_balance = to_float(txn["BALANCE"])
-                                transactions.append(txn)
-                        # start a fresh buffer
-                        current_row_lines = [ln_stripped]
-                    else:
-                        if current_row_lines is None:
-                            # ignore noise before the first date (shouldn't normally happen)
-                            continue
-                        current_row_lines.append(ln_stripped)
+                # Strip once, then find every date-led line in a single pass and
+                # slice the page into per-transaction buffers between them
+                rows = [ln for ln in map(str.strip, lines[start_idx:]) if ln]
+                starts = [i for i, ln in enumerate(rows) if _is_date_start(ln)]
+
+                # Lines before the page's first date continue the buffer carried
+                # over from the previous page (noise if there is none yet)
+                lead = rows[: starts[0]] if starts else rows
+                if current_row_lines is not None:
+                    current_row_lines.extend(lead)
+
+                for a, b in zip(starts, starts[1:] + [len(rows)]):
+                    # finalize previous buffer
+                    if current_row_lines:
+                        txn = _build_transaction(current_row_lines, prev_balance)
+                        if txn:
+                            prev_balance = to_float(txn["BALANCE"])
+                            transactions.append(txn)
+                    # start a fresh buffer
+                    current_row_lines = rows[a:b]
 
             # flush final buffered transaction
             if current_row_lines:
@@ -112,16 +128,16 @@ def parse(path: str) -> List[Dict[str, str]]:
                     transactions.append(txn)
 
         if transactions:
-            print(f"(wema): Parsed {len(transactions)} transactions", file=sys.stderr)
-            print(f"(wema): First sample: {transactions[0]}", file=sys.stderr)
+            logger.debug("(wema): Parsed %d transactions", len(transactions))
+            logger.debug("(wema): First sample: %s", transactions[0])
         else:
-            print("(wema): No transactions parsed", file=sys.stderr)
+            logger.debug("(wema): No transactions parsed")
 
         # run checks (adds Check/Check 2) and return
         return calculate_checks(transactions)
 
     except Exception as e:
-        print(f"(wema): Error processing Wema statement: {e}", file=sys.stderr)
+        logger.error("(wema): Error processing Wema statement: %s", e)
         return []
 
 
@@ -140,13 +156,11 @@ def _extract_trailing_year_and_clean(
     for i in range(1, min(3, len(lines_copy) + 1)):
         ln = lines_copy[-i].strip()
         # If the line starts with a clean 4-digit year (or 2-digit)
-        m = re.match(r"^\s*(20\d{2}|19\d{2}|\d{2})\b", ln)
+        m = TRAILING_YEAR_RE.match(ln)
         if m:
             trailing_year = m.group(1)
-            # remove the year token from that line
-            new_ln = re.sub(
-                r"^\s*(20\d{2}|19\d{2}|\d{2})\b", "", lines_copy[-i]
-            ).strip()
+            # remove the year token from that line, reusing the match's end offset
+            new_ln = ln[m.end() :].strip()
             if new_ln:
                 lines_copy[-i] = new_ln
             else:
@@ -156,15 +170,19 @@ def _extract_trailing_year_and_clean(
     return trailing_year, lines_copy
 
 
-def _repair_money_tokens(remainder: str) -> List[str]:
+def _repair_money_tokens(remainder: str, found: List[str]) -> List[str]:
     """
-    Return money tokens found in remainder. If not enough tokens are found,
-    attempt to repair split tokens by combining adjacent tokens that together
-    match the MONEY_RE (e.g. '25,' + '500.00' -> '25,500.00').
+    Return money tokens found in remainder. `found` is the caller's MONEY_RE
+    scan of the same string. If not enough tokens are found, attempt to repair
+    split tokens by combining adjacent tokens that together match the MONEY_RE
+    (e.g. '25,' + '500.00' -> '25,500.00').
     """
-    found = MONEY_RE.findall(remainder)
     if len(found) >= 2:
         return found
+    # Every repaired token needs its own ".dd"; with fewer than two dots the repair
+    # cannot reach the two tokens the caller needs, so skip the token loop
+    if remainder.count(".") < 2:
+        return found
 
     # token-level attempt to combine adjacent tokens
     tokens = remainder.split()
@@ -203,20 +221,66 @@ def _repair_money_tokens(remainder: str) -> List[str]:
     return combined if combined else found
 
 
+def _amount_to_float(s: str) -> float:
+    """
+    Parse a comma-stripped money token. Plain "digits.dd" tokens (the usual
+    MONEY_RE output) go straight to float(); anything else falls back to to_float.
+    """
+    if s.replace(".", "", 1).isdigit():
+        try:
+            return float(s)
+        except ValueError:
+            pass
+    return to_float(s)
+
+
 def _clean_remarks_from(remainder_no_money: str, reference: str) -> str:
     """
     Remove extra whitespace, reference token, and standalone year tokens from remarks.
     """
     r = remainder_no_money
     if reference:
-        r = re.sub(re.escape(reference), " ", r, flags=re.I)
+        # reference is an upper-cased REF_RE match (one letter + digits), so its
+        # only case variants are this and the lower-cased letter
+        r = r.replace(reference, " ").replace(reference.lower(), " ")
     # remove leftover standalone 4-digit years like 2024/2025
-    r = re.sub(r"\b20\d{2}\b", " ", r)
-    # collapse whitespace and strip
-    r = re.sub(r"\s+", " ", r).strip()
+    r = STANDALONE_YEAR_RE.sub(" ", r)
+    # collapse whitespace and strip (split() uses the same whitespace set as \s)
+    r = " ".join(r.split())
     return r
 
 
+def _resolve_amounts(
+    amt_val: float, bal_val: float, prev_balance: Optional[float], remarks: str
+) -> Tuple[str, str]:
+    """
+    Decide whether the amount is a debit or a credit and format both columns.
+    Pure float logic, kept apart from the regex work in _build_transaction.
+    """
+    amount = f"{amt_val:.2f}"
+    if prev_balance is not None:
+        # ✅ Compare new balance with previous → direction of transaction
+        if bal_val < prev_balance:
+            return amount, "0.00"
+        if bal_val > prev_balance:
+            return "0.00", amount
+        return "0.00", "0.00"
+
+    # 🧠 First transaction — no previous balance yet
+    # Try to infer likely direction using context keywords
+    remarks_lower = remarks.lower()
+    if (
+        "vat" in remarks_lower
+        or "fee" in remarks_lower
+        or "charge" in remarks_lower
+        or "transfer" in remarks_lower
+    ):
+        # Charges, fees, and VATs are usually debits
+        return amount, "0.00"
+    # Otherwise assume incoming credit (e.g., salary, transfer, deposit)
+    return "0.00", amount
+
+
 def _build_transaction(
     lines: List[str], prev_balance: Optional[float]
 ) -> Optional[Dict[str, str]]:
@@ -230,14 +294,14 @@ def _build_transaction(
     """
     try:
         # 1. Build a joined version of all text lines (makes regex easier)
-        lines_copy = list(lines)
-        full_text = " ".join(lines_copy).strip()
+        full_text = " ".join(lines).strip()
 
         # 2. Try to match a full date like "03-Mar-2025" directly
         dmatch = FULL_DATE_RE.search(full_text)
         date_str = ""
         trailing_year = None
-        lines_cleaned = list(lines_copy)
+        # Read-only until replaced; _extract_trailing_year_and_clean works on its own copy
+        lines_cleaned = lines
 
         if dmatch:
             # Found a single-line full date → perfect
@@ -255,12 +319,12 @@ def _build_transaction(
             year_token = trailing_year
             if not year_token:
                 # Prefer a 4-digit year found anywhere
-                y_match = re.findall(r"\b(20\d{2}|19\d{2})\b", full_text)
+                y_match = YEAR4_RE.findall(full_text)
                 if y_match:
                     year_token = y_match[-1]
                 else:
                     # fallback: last 2-digit year token
-                    y2 = re.findall(r"\b(\d{2})\b", full_text)
+                    y2 = YEAR2_RE.findall(full_text)
                     if y2:
                         year_token = y2[-1]
 
@@ -286,12 +350,15 @@ def _build_transaction(
                 )
 
         # 4. Extract money values (should be [amount, balance]) — auto-repair if tokens are split
-        money_tokens = _repair_money_tokens(remainder)
+        # One MONEY_RE pass gives both the tokens and the spans stripped out in step 6
+        money_matches = list(MONEY_RE.finditer(remainder))
+        found = [m.group(0) for m in money_matches]
+        money_tokens = _repair_money_tokens(remainder, found)
         if len(money_tokens) < 2:
             # fallback: native regex
-            money_tokens = MONEY_RE.findall(remainder)
+            money_tokens = found
         if len(money_tokens) < 2:
-            print(f"(wema): skipping txn (bad money tokens) {lines}", file=sys.stderr)
+            logger.debug("(wema): skipping txn (bad money tokens) %s", lines)
             return None
 
         # Normalize numeric tokens → remove spaces/commas
@@ -299,60 +366,40 @@ def _build_transaction(
         amount_str = money_tokens[-2].replace(",", "")
         balance_str = money_tokens[-1].replace(",", "")
 
-        amt_val = to_float(amount_str)
-        bal_val = to_float(balance_str)
+        amt_val = _amount_to_float(amount_str)
+        bal_val = _amount_to_float(balance_str)
 
         # 5. Extract reference (alphanumeric code like S95223404)
         ref_match = REF_RE.search(remainder)
         reference = ref_match.group(1).upper() if ref_match else ""
 
         # 6. Clean up remarks (remove money tokens, references, and standalone years)
-        remainder_no_money = MONEY_RE.sub(" ", remainder)
+        pieces = []
+        pos = 0
+        for m in money_matches:
+            pieces.append(remainder[pos : m.start()])
+            pos = m.end()
+        pieces.append(remainder[pos:])
+        remainder_no_money = " ".join(pieces)
         remarks = _clean_remarks_from(remainder_no_money, reference)
 
         # 7. Determine DEBIT or CREDIT value
-        debit, credit = "0.00", "0.00"
-
-        if prev_balance is not None:
-            # ✅ Compare new balance with previous → direction of transaction
-            if bal_val < prev_balance:
-                debit = f"{amt_val:.2f}"
-            elif bal_val > prev_balance:
-                credit = f"{amt_val:.2f}"
-        else:
-            # 🧠 First transaction — no previous balance yet
-            # Try to infer likely direction using context keywords
-            if (
-                "vat" in remarks.lower()
-                or "fee" in remarks.lower()
-                or "charge" in remarks.lower()
-                or "transfer" in remarks.lower()
-            ):
-                # Charges, fees, and VATs are usually debits
-                debit = f"{amt_val:.2f}"
-            else:
-                # Otherwise assume incoming credit (e.g., salary, transfer, deposit)
-                credit = f"{amt_val:.2f}"
+        debit, credit = _resolve_amounts(amt_val, bal_val, prev_balance, remarks)
 
         # 8️⃣ Construct standardized transaction dict
         txn = STANDARDIZED_ROW.copy()
-        txn.update(
-            {
-                "TXN_DATE": txn_date,
-                "VAL_DATE": txn_date,
-                "REFERENCE": reference,
-                "REMARKS": remarks,
-                "DEBIT": debit,
-                "CREDIT": credit,
-                "BALANCE": f"{bal_val:.2f}",
-            }
-        )
+        txn["TXN_DATE"] = txn_date
+        txn["VAL_DATE"] = txn_date
+        txn["REFERENCE"] = reference
+        txn["REMARKS"] = remarks
+        txn["DEBIT"] = debit
+        txn["CREDIT"] = credit
+        txn["BALANCE"] = f"{bal_val:.2f}"
 
         return txn
 
     except Exception as e:
-        print(
-            f"(wema): Failed to build transaction from lines {lines} — {e}",
-            file=sys.stderr,
+        logger.warning(
+            "(wema): Failed to build transaction from lines %s — %s", lines, e
         )
         return None
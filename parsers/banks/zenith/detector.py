@@ -1,28 +1,34 @@
-import pdfplumber
 import re
 import sys
-from typing import Callable, Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Tuple
 from .universal import parse as parse_universal
 from .model_01 import parse as parse_model_01  # Updated name
+from utils import first_page_text
 
 # Map variant keys directly to their parser functions
 PARSER_MAP: Dict[str, Callable[[str], List[Dict[str, str]]]] = {
     "model_01": parse_model_01,
 }
 
-# Define text patterns unique to each Zenith statement variant
-VARIANT_PATTERNS = {
-    "model_01": [
+# Define text patterns unique to each Zenith statement variant.
+# Plain substrings are listed rarest first so all() bails out on the first miss.
+VARIANT_STR_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "model_01": (
         "date posted",
         "value date",
         "description",
-        "debit",
-        "credit",
         "balance",
-    ],
+        "credit",
+        "debit",
+    ),
     # Add new variants (e.g. model_02) as needed
 }
 
+# Compiled regexes a variant must also match (checked after the substrings)
+VARIANT_RE_PATTERNS: Dict[str, Tuple[re.Pattern, ...]] = {
+    "model_01": (),
+}
+
 
 def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]:
     """
@@ -30,33 +36,30 @@ def detect_variant(path: str) -> Optional[Callable[[str], List[Dict[str, str]]]]
     Returns the appropriate parser function.
     """
     try:
-        with pdfplumber.open(path) as pdf:
-            if not pdf.pages:
-                return None
-
-            # Extract text from the first page for variant detection
-            text = pdf.pages[0].extract_text() or ""
-            text_lower = text.lower()
-
-            # Try to match each known variant
-            for variant, patterns in VARIANT_PATTERNS.items():
-                if all(
-                    (isinstance(p, str) and p in text_lower)
-                    or (isinstance(p, re.Pattern) and p.search(text_lower))
-                    for p in patterns
-                ):
-                    print(
-                        f"(zenith_detector): Detected Zenith variant: {variant}",
-                        file=sys.stderr,
-                    )
-                    return PARSER_MAP.get(variant, parse_universal)
-
-            # Default fallback if no variant matched
-            print(
-                "(zenith_detector): No specific variant detected, using universal parser",
-                file=sys.stderr,
-            )
-            return parse_universal
+        # First-page text is cached, so model_01 reuses it instead of extracting again
+        text = first_page_text(path)
+        if text is None:
+            return None
+        text_lower = text.lower()
+
+        # Try to match each known variant
+        for variant, str_patterns in VARIANT_STR_PATTERNS.items():
+            re_patterns = VARIANT_RE_PATTERNS.get(variant, ())
+            if all(p in text_lower for p in str_patterns) and all(
+                r.search(text_lower) for r in re_patterns
+            ):
+                print(
+                    f"(zenith_detector): Detected Zenith variant: {variant}",
+                    file=sys.stderr,
+                )
+                return PARSER_MAP.get(variant, parse_universal)
+
+        # Default fallback if no variant matched
+        print(
+            "(zenith_detector): No specific variant detected, using universal parser",
+            file=sys.stderr,
+        )
+        return parse_universal
 
     except Exception as e:
         print(f"(zenith_detector): Error during detection: {e}", file=sys.stderr)
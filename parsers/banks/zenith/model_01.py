@@ -1,6 +1,5 @@
-import pdfplumber
+import logging
 import re
-import sys
 from typing import List, Dict
 from utils import (
     normalize_date,
@@ -8,8 +7,12 @@ from utils import (
     calculate_checks,
     STANDARDIZED_ROW,
     normalize_money,
+    first_page_text,
+    open_pdf,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # Keywords that signal noise (summaries, headers, footers)
 SKIP_KEYWORDS = [
@@ -27,83 +30,91 @@ SKIP_KEYWORDS = [
     "currency:",
     "payment services limited",
 ]
+# All keywords fused into one alternation: a single scan per line instead of one per keyword
+SKIP_RE = re.compile("|".join(map(re.escape, SKIP_KEYWORDS)))
+
+# Standard transaction row: posted date, value date, description, debit, credit, balance
+TXN_RE = re.compile(
+    r"^(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})\s+(.*?)(-?[\d,]*\.\d{2})\s+(-?[\d,]*\.\d{2})\s+(-?[\d,]*\.\d{2})$"
+)
+
+
+def _is_noise_lower(line_lower: str) -> bool:
+    """is_noise_line for a line the caller has already lower-cased."""
+    return SKIP_RE.search(line_lower) is not None
 
 
 def is_noise_line(line: str) -> bool:
     """Check if a line is summary/header/footer noise."""
-    line_lower = line.lower()
-    return any(kw in line_lower for kw in SKIP_KEYWORDS)
+    return _is_noise_lower(line.lower())
 
 
 def parse(path: str) -> List[Dict[str, str]]:
     transactions: List[Dict[str, str]] = []
 
     try:
-        with pdfplumber.open(path) as pdf:
+        with open_pdf(path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
-                print(f"(zenith_model_01): Processing page {page_num}", file=sys.stderr)
+                logger.debug("(zenith_model_01): Processing page %d", page_num)
 
-                text = page.extract_text() or ""
-                lines = text.split("\n")
+                # Page 1 was already extracted (and cached) by the detector
+                text = (
+                    first_page_text(path) if page_num == 1 else page.extract_text()
+                ) or ""
+                # Only the text is needed from here on; drop the page's cached layout objects
+                page.close()
+                # Strip once up front and drop blank lines before the per-line checks
+                lines = [ln for ln in map(str.strip, text.split("\n")) if ln]
 
                 for line in lines:
-                    line = line.strip()
-                    if not line:
+                    line_lower = line.lower()
+                    if _is_noise_lower(line_lower):
                         continue
-                    if is_noise_line(line):
+
+                    # Match standard transaction rows first: they are the common
+                    # case, and a date-led line is never an "Opening Balance" line
+                    match = TXN_RE.match(line)
+                    if match:
+                        txn_date, val_date, desc, debit, credit, balance = (
+                            match.groups()
+                        )
+                        # REFERENCE keeps the template's "" default
+                        row = STANDARDIZED_ROW.copy()
+                        row["TXN_DATE"] = normalize_date(txn_date)
+                        row["VAL_DATE"] = normalize_date(val_date)
+                        row["REMARKS"] = desc.strip()
+                        row["DEBIT"] = normalize_money(debit)
+                        row["CREDIT"] = normalize_money(credit)
+                        row["BALANCE"] = normalize_money(balance)
+                        transactions.append(row)
                         continue
 
                     # Handle pure "Opening Balance" line
-                    if line.lower().startswith("opening balance"):
+                    if line_lower.startswith("opening balance"):
                         parts = line.split()
                         if parts and to_float(parts[-1]) != 0.0:
                             opening_balance = to_float(parts[-1])
-                            row = STANDARDIZED_ROW.copy()
-                            row.update(
-                                {
-                                    "TXN_DATE": "",
-                                    "VAL_DATE": "",
-                                    "REFERENCE": "",
-                                    "REMARKS": "Opening Balance",
-                                    "DEBIT": "0.00",
-                                    "CREDIT": "0.00",
-                                    "BALANCE": f"{opening_balance:.2f}",
-                                    "Check": "TRUE",
-                                    "Check 2": "0.00",
-                                }
-                            )
+                            # Every STANDARDIZED_ROW key is set, so build the row directly
+                            row = {
+                                "TXN_DATE": "",
+                                "VAL_DATE": "",
+                                "REFERENCE": "",
+                                "REMARKS": "Opening Balance",
+                                "DEBIT": "0.00",
+                                "CREDIT": "0.00",
+                                "BALANCE": f"{opening_balance:.2f}",
+                                "Check": "TRUE",
+                                "Check 2": "0.00",
+                            }
                             transactions.append(row)
                         continue
 
-                    # Match standard transaction rows
-                    match = re.match(
-                        r"^(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})\s+(.*?)(-?[\d,]*\.\d{2})\s+(-?[\d,]*\.\d{2})\s+(-?[\d,]*\.\d{2})$",
-                        line,
-                    )
-                    if match:
-                        txn_date, val_date, desc, debit, credit, balance = (
-                            match.groups()
-                        )
-                        row = STANDARDIZED_ROW.copy()
-                        row.update(
-                            {
-                                "TXN_DATE": normalize_date(txn_date),
-                                "VAL_DATE": normalize_date(val_date),
-                                "REFERENCE": "",
-                                "REMARKS": desc.strip(),
-                                "DEBIT": f"{normalize_money(debit)}",
-                                "CREDIT": f"{normalize_money(credit)}",
-                                "BALANCE": f"{normalize_money(balance)}",
-                            }
-                        )
-                        transactions.append(row)
-                    else:
-                        # Continuation lines: only if not noise
-                        if transactions and not is_noise_line(line):
-                            transactions[-1]["REMARKS"] += " " + line.strip()
+                    # Continuation lines (noise was already skipped above)
+                    if transactions:
+                        transactions[-1]["REMARKS"] += " " + line
 
         return calculate_checks(transactions)
 
     except Exception as e:
-        print(f"Error in zenith model_01: {e}", file=sys.stderr)
+        logger.error("Error in zenith model_01: %s", e)
         return []
@@ -1,17 +1,31 @@
-import sys
+import logging
 import re
-import pdfplumber
 from typing import List, Dict
 from utils import (
     normalize_column_name,
     FIELD_MAPPINGS,
+    MAIN_TABLE_SETTINGS,
     normalize_date,
     to_float,
     normalize_money,
     parse_text_row,
     calculate_checks,
+    open_pdf,
+    page_run_workers,
+    map_page_runs,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _page_tables(page, page_num: int) -> List[List[List[str]]]:
+    """Extract the tables from one page and release its cached layout objects."""
+    logger.debug("(zenith): Processing page %d", page_num)
+    tables = page.extract_tables(MAIN_TABLE_SETTINGS) or []
+    # Only the extracted cells are needed from here on
+    page.close()
+    return tables
+
 
 def parse(path: str) -> List[Dict[str, str]]:
     transactions = []
@@ -19,153 +33,145 @@ def parse(path: str) -> List[Dict[str, str]]:
     global_header_map = None
 
     try:
-        with pdfplumber.open(path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                print(f"(zenith): Processing page {page_num}", file=sys.stderr)
-                # Table extraction settings
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 1,
-                }
-                tables = page.extract_tables(table_settings)
-
-                if tables:
-                    for table in tables:
-                        if not table or len(table) < 1:
-                            continue
-
-                        first_row = table[0]
-                        normalized_first_row = [
-                            normalize_column_name(h) if h else "" for h in first_row
-                        ]
-                        is_header_row = any(
-                            h in FIELD_MAPPINGS for h in normalized_first_row if h
-                        )
+        with open_pdf(path) as pdf:
+            page_count = len(pdf.pages)
+            parallel = page_run_workers(page_count) > 1
+            if not parallel:
+                page_tables = [
+                    _page_tables(page, page_num)
+                    for page_num, page in enumerate(pdf.pages, 1)
+                ]
+
+        if parallel:
+            # Table extraction is independent per page; the header/balance handling below
+            # still runs in page order
+            page_tables = map_page_runs(path, page_count, _page_tables)
+
+        for page_num, tables in enumerate(page_tables, 1):
+            if tables:
+                for table in tables:
+                    if not table or len(table) < 1:
+                        continue
+
+                    first_row = table[0]
+                    normalized_first_row = [
+                        normalize_column_name(h) if h else "" for h in first_row
+                    ]
+                    is_header_row = any(
+                        h in FIELD_MAPPINGS for h in normalized_first_row if h
+                    )
 
-                        if is_header_row and not global_headers:
-                            global_headers = normalized_first_row
-                            global_header_map = {
-                                i: h
-                                for i, h in enumerate(global_headers)
-                                if h in FIELD_MAPPINGS
-                            }
-                            print(
-                                f"Stored global headers: {global_headers}",
-                                file=sys.stderr,
+                    if is_header_row and not global_headers:
+                        global_headers = normalized_first_row
+                        global_header_map = {
+                            i: h
+                            for i, h in enumerate(global_headers)
+                            if h in FIELD_MAPPINGS
+                        }
+                        logger.debug("Stored global headers: %s", global_headers)
+                        data_rows = table[1:]
+                    elif is_header_row and global_headers:
+                        if normalized_first_row == global_headers:
+                            logger.debug(
+                                "Skipping repeated header row on page %d", page_num
                             )
                             data_rows = table[1:]
-                        elif is_header_row and global_headers:
-                            if normalized_first_row == global_headers:
-                                print(
-                                    f"Skipping repeated header row on page {page_num}",
-                                    file=sys.stderr,
-                                )
-                                data_rows = table[1:]
-                            else:
-                                print(
-                                    f"Different headers on page {page_num}, treating as data",
-                                    file=sys.stderr,
-                                )
-                                data_rows = table
                         else:
-                            data_rows = table
-
-                        if not global_headers:
-                            print(
-                                f"(zenith): No headers found by page {page_num}, skipping table",
-                                file=sys.stderr,
+                            logger.debug(
+                                "Different headers on page %d, treating as data",
+                                page_num,
                             )
-                            continue
+                            data_rows = table
+                    else:
+                        data_rows = table
 
-                        has_amount = "AMOUNT" in global_headers
-                        balance_idx = (
-                            global_headers.index("BALANCE")
-                            if "BALANCE" in global_headers
-                            else -1
+                    if not global_headers:
+                        logger.debug(
+                            "(zenith): No headers found by page %d, skipping table",
+                            page_num,
                         )
-                        prev_balance = None
+                        continue
 
-                        for row in data_rows:
-                            if len(row) < len(global_headers):
-                                row.extend([""] * (len(global_headers) - len(row)))
+                    has_amount = "AMOUNT" in global_headers
+                    balance_idx = (
+                        global_headers.index("BALANCE")
+                        if "BALANCE" in global_headers
+                        else -1
+                    )
+                    prev_balance = None
 
-                            row_dict = {
-                                global_headers[i]: row[i] if i < len(row) else ""
-                                for i in range(len(global_headers))
-                            }
+                    for row in data_rows:
+                        if len(row) < len(global_headers):
+                            row.extend([""] * (len(global_headers) - len(row)))
 
-                            standardized_row = {
-                                "TXN_DATE": normalize_date(
-                                    row_dict.get(
-                                        "TXN_DATE", row_dict.get("VAL_DATE", "")
-                                    )
-                                ),
-                                "VAL_DATE": normalize_date(
-                                    row_dict.get(
-                                        "VAL_DATE", row_dict.get("TXN_DATE", "")
-                                    )
-                                ),
-                                "REFERENCE": row_dict.get("REFERENCE", ""),
-                                "REMARKS": row_dict.get("REMARKS", ""),
-                                "DEBIT": "",
-                                "CREDIT": "",
-                                "BALANCE": (
-                                    f"{to_float(row_dict.get('BALANCE', '')):.2f}"
-                                    if (row_dict.get("BALANCE", "") or "").strip()
-                                    else ""
-                                ),
-                                "Check": "",
-                                "Check 2": "",
-                            }
-
-                            if has_amount and balance_idx != -1:
-                                amount = to_float(row_dict.get("AMOUNT", ""))
-                                current_balance = to_float(row_dict.get("BALANCE", ""))
-
-                                if prev_balance is not None:
-                                    if current_balance < prev_balance:
-                                        standardized_row["DEBIT"] = f"{abs(amount):.2f}"
-                                        standardized_row["CREDIT"] = "0.00"
-                                    else:
-                                        standardized_row["DEBIT"] = "0.00"
-                                        standardized_row["CREDIT"] = (
-                                            f"{abs(amount):.2f}"
-                                        )
+                        # Short rows were padded above, so zip pairs every column
+                        row_dict = dict(zip(global_headers, row))
+
+                        standardized_row = {
+                            "TXN_DATE": normalize_date(
+                                row_dict.get(
+                                    "TXN_DATE", row_dict.get("VAL_DATE", "")
+                                )
+                            ),
+                            "VAL_DATE": normalize_date(
+                                row_dict.get(
+                                    "VAL_DATE", row_dict.get("TXN_DATE", "")
+                                )
+                            ),
+                            "REFERENCE": row_dict.get("REFERENCE", ""),
+                            "REMARKS": row_dict.get("REMARKS", ""),
+                            "DEBIT": "",
+                            "CREDIT": "",
+                            "BALANCE": (
+                                f"{to_float(row_dict.get('BALANCE', '')):.2f}"
+                                if (row_dict.get("BALANCE", "") or "").strip()
+                                else ""
+                            ),
+                            "Check": "",
+                            "Check 2": "",
+                        }
+
+                        if has_amount and balance_idx != -1:
+                            amount = to_float(row_dict.get("AMOUNT", ""))
+                            current_balance = to_float(row_dict.get("BALANCE", ""))
+
+                            if prev_balance is not None:
+                                if current_balance < prev_balance:
+                                    standardized_row["DEBIT"] = f"{abs(amount):.2f}"
+                                    standardized_row["CREDIT"] = "0.00"
                                 else:
                                     standardized_row["DEBIT"] = "0.00"
-                                    standardized_row["CREDIT"] = "0.00"
-                                prev_balance = current_balance
+                                    standardized_row["CREDIT"] = (
+                                        f"{abs(amount):.2f}"
+                                    )
                             else:
-                                standardized_row["DEBIT"] = normalize_money(
-                                    row_dict.get("DEBIT", "0.00")
-                                )
-                                standardized_row["CREDIT"] = normalize_money(
-                                    row_dict.get("CREDIT", "0.00")
-                                )
-                                prev_balance = (
-                                    to_float(standardized_row["BALANCE"])
-                                    if standardized_row["BALANCE"]
-                                    else prev_balance
-                                )
+                                standardized_row["DEBIT"] = "0.00"
+                                standardized_row["CREDIT"] = "0.00"
+                            prev_balance = current_balance
+                        else:
+                            standardized_row["DEBIT"] = normalize_money(
+                                row_dict.get("DEBIT", "0.00")
+                            )
+                            standardized_row["CREDIT"] = normalize_money(
+                                row_dict.get("CREDIT", "0.00")
+                            )
+                            prev_balance = (
+                                to_float(standardized_row["BALANCE"])
+                                if standardized_row["BALANCE"]
+                                else prev_balance
+                            )
 
+                        # Undated rows are dropped here instead of in a final pass
+                        if standardized_row["TXN_DATE"] or standardized_row["VAL_DATE"]:
                             transactions.append(standardized_row)
-                else:
-                    print(
-                        f"(zenith): No tables found on page {page_num}, attempting text extraction",
-                        file=sys.stderr,
-                    )
+            else:
+                logger.debug(
+                    "(zenith): No tables found on page %d, attempting text extraction",
+                    page_num,
+                )
 
-        return calculate_checks(
-            [t for t in transactions if t["TXN_DATE"] or t["VAL_DATE"]]
-        )
+        return calculate_checks(transactions)
 
     except Exception as e:
-        print(f"Error processing Zenith Bank statement: {e}", file=sys.stderr)
+        logger.error("Error processing Zenith Bank statement: %s", e)
         return []
@@ -1,21 +1,42 @@
+import logging
+import sys
 from typing import Dict, List
 import pdfplumber
 from utils import MAIN_TABLE_SETTINGS
 
+logger = logging.getLogger(__name__)
+
 
 def parse(path: str) -> List[Dict[str, str]]:
     transactions = []
-    global_headers = None
+    # The tables are only logged, so with debug logging off there is nothing to do
+    if not logger.isEnabledFor(logging.DEBUG):
+        return transactions
 
     with pdfplumber.open(path) as pdf:
         for i, page in enumerate(pdf.pages, start=1):
-            print("\n=== PAGE", i, "===")
             tables = page.extract_tables(MAIN_TABLE_SETTINGS)
+            # Release the page's parsed objects so only one page is held at a time
+            page.close()
+            logger.debug("=== PAGE %d ===", i)
             if not tables:
-                print("NO TABLES")
+                logger.debug("NO TABLES")
             else:
                 for t_index, table in enumerate(tables):
-                    print(f"--- TABLE {t_index} ---")
+                    logger.debug("--- TABLE %d ---", t_index)
                     for row in table:
-                        print(row)
+                        logger.debug("%s", row)
     return transactions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(
+            "Usage: python check_for_tables.py path/to/statement.pdf", file=sys.stderr
+        )
+        sys.exit(1)
+
+    # Debug output for this dump only, not pdfminer's own debug logging
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    parse(sys.argv[1])
@@ -2,15 +2,39 @@ import sys
 import json
 import argparse
 import os
-from typing import List, Dict, Callable, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Callable, Any, Optional, Tuple
 import importlib
 
 from validator import is_valid_parse
 from main_parser import main_parse
-from utils import decrypt_pdf
+from utils import decrypt_pdf, disable_page_workers, shared_pdf
 from main_metadata import extract_metadata, verify_legitimacy
 
 
+@lru_cache(maxsize=64)
+def _load_bank(bank: str) -> Tuple[Optional[Callable], Optional[Callable]]:
+    """
+    Resolve (detect_variant, universal parse) for a bank once per process.
+    Either entry is None when the bank has no such module.
+    """
+    bank_module_path = f"banks.{bank.replace('-', '_')}"
+    try:
+        detector_module = importlib.import_module(f"{bank_module_path}.detector")
+        detect_variant = getattr(detector_module, "detect_variant")
+    except (ImportError, AttributeError):
+        return None, None
+
+    try:
+        universal_module = importlib.import_module(f"{bank_module_path}.universal")
+        universal_parse = getattr(universal_module, "parse")
+    except (ImportError, AttributeError):
+        universal_parse = None
+    return detect_variant, universal_parse
+
+
 def dispatch_parse(pdf_path: str, bank: str, password: str = "") -> Dict[str, Any]:
     """
     Parses a statement PDF using bank-specific or universal parsers.\n
@@ -32,73 +56,66 @@ def dispatch_parse(pdf_path: str, bank: str, password: str = "") -> Dict[str, An
         # Decrypt if necessary (your utils returns (temp_path, effective_path))
         temp_file_path, effective_path = decrypt_pdf(pdf_path, password)
 
-        # Prefer bank-specific parser via detector → universal
-        try:
-            bank_module_path = f"banks.{bank.replace('-', '_')}"
-            detector_module = importlib.import_module(f"{bank_module_path}.detector")
-            detect_variant = getattr(detector_module, "detect_variant")
-        except (ImportError, AttributeError):
-            print(
-                f"No specific parsers for bank, '{bank}' (dispatch.py)",
-                file=sys.stderr,
-            )
-            detect_variant = None
-
-        parser_func: Callable[[str], List[Dict[str, str]]] | None = None
-        if detect_variant:
-            parser_func = detect_variant(effective_path)
-
-        if parser_func is None and detect_variant is not None:
-            # fall back to bank universal if detector could not resolve a variant
-            try:
-                universal_module = importlib.import_module(
-                    f"{bank_module_path}.universal"
+        # Detector, parser and metadata all read the same file; open and parse it once
+        with shared_pdf(effective_path):
+            # Prefer bank-specific parser via detector → universal
+            detect_variant, universal_parse = _load_bank(bank)
+            if detect_variant is None:
+                print(
+                    f"No specific parsers for bank, '{bank}' (dispatch.py)",
+                    file=sys.stderr,
                 )
-                parser_func = getattr(universal_module, "parse")
-            except (ImportError, AttributeError):
-                parser_func = None
 
-        # Try chosen bank parser first
-        if parser_func:
-            try:
-                result = parser_func(effective_path)
+            parser_func: Callable[[str], List[Dict[str, str]]] | None = None
+            if detect_variant:
+                parser_func = detect_variant(effective_path)
+
+            if parser_func is None and detect_variant is not None:
+                # fall back to bank universal if detector could not resolve a variant
+                parser_func = universal_parse
+
+            # Try chosen bank parser first
+            if parser_func:
+                try:
+                    result = parser_func(effective_path)
+                    if is_valid_parse(result):
+                        print(
+                            f"Success with {bank} parser: {parser_func.__module__}",
+                            file=sys.stderr,
+                        )
+                        transactions = result
+                    else:
+                        print(
+                            f"{bank} parser returned invalid parse; falling back to main parser",
+                            file=sys.stderr,
+                        )
+                except Exception as e:
+                    print(f"Failed {bank} parser: {e}", file=sys.stderr)
+
+            # If still empty/invalid, use global fallback
+            if not transactions:
+                result = main_parse(effective_path)
                 if is_valid_parse(result):
-                    print(
-                        f"Success with {bank} parser: {parser_func.__module__}",
-                        file=sys.stderr,
-                    )
+                    print("Success with main parser", file=sys.stderr)
                     transactions = result
-                else:
-                    print(
-                        f"{bank} parser returned invalid parse; falling back to main parser",
-                        file=sys.stderr,
-                    )
-            except Exception as e:
-                print(f"Failed {bank} parser: {e}", file=sys.stderr)
 
-        # If still empty/invalid, use global fallback
-        if not transactions:
-            result = main_parse(effective_path)
-            if is_valid_parse(result):
-                print("Success with main parser", file=sys.stderr)
-                transactions = result
-
-        # If nothing worked, error out as before
-        if not transactions:
-            raise ValueError(
-                "No suitable parser found for this statement. Please check the PDF or add a new variant. (dispatch.py)"
-            )
+            # If nothing worked, error out as before
+            if not transactions:
+                raise ValueError(
+                    "No suitable parser found for this statement. Please check the PDF or add a new variant. (dispatch.py)"
+                )
 
-        # === New bits: metadata + legitimacy checks ===
-        meta = extract_metadata(effective_path)
-        checks = verify_legitimacy(meta, transactions, meta.get("raw_header"))
+            # === New bits: metadata + legitimacy checks ===
+            meta = extract_metadata(effective_path)
+            checks = verify_legitimacy(meta, transactions, meta.get("raw_header"))
 
         # Overall parse quality (kept from your original flow)
+        parse_ok = is_valid_parse(transactions)
         checks.append(
             {
                 "id": "parse_quality_gate",
-                "ok": is_valid_parse(transactions),
-                "severity": "good" if is_valid_parse(transactions) else "fail",
+                "ok": parse_ok,
+                "severity": "good" if parse_ok else "fail",
                 "message": "Overall parse quality threshold (table detection/normalization).",
             }
         )
@@ -119,15 +136,110 @@ def dispatch_parse(pdf_path: str, bank: str, password: str = "") -> Dict[str, An
                 print(f"Failed to delete temp file: {e}", file=sys.stderr)
 
 
+def _batch_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    A process pool for one batch call (one worker per CPU by default). Its workers
+    each handle whole statements, so their page extraction stays in-process instead
+    of starting a page pool of its own.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, initializer=disable_page_workers
+    )
+
+
+def parse_many(
+    pdf_paths: List[str],
+    bank: str,
+    password: str = "",
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Runs dispatch_parse over several independent statements in a process pool.\n
+    Returns one payload per path, in the order given.
+    """
+    if len(pdf_paths) < 2:
+        return [dispatch_parse(p, bank, password) for p in pdf_paths]
+
+    with _batch_pool(max_workers) as pool:
+        return list(
+            pool.map(dispatch_parse, pdf_paths, repeat(bank), repeat(password))
+        )
+
+
+def decrypt_pdf_batch(
+    pdf_paths: List[str], password: str = "", max_workers: Optional[int] = None
+) -> List[Tuple[str, str]]:
+    """
+    Runs decrypt_pdf over several statements in a process pool.\n
+    Returns one (readable_path, effective_path) per path, in the order given; the
+    caller deletes any temporary decrypted copies, as after decrypt_pdf.
+    Files are spread across processes, never split: pikepdf/qpdf handles are not
+    shared between threads, and one file's decryption is a single native call.
+    """
+    if len(pdf_paths) < 2:
+        return [decrypt_pdf(p, password) for p in pdf_paths]
+
+    with _batch_pool(max_workers) as pool:
+        return list(pool.map(decrypt_pdf, pdf_paths, repeat(password)))
+
+
+def _dispatch_job(job: Tuple[str, str, str]) -> Dict[str, Any]:
+    """Parse one (pdf_path, bank, password) job, reporting failure in the payload."""
+    pdf_path, bank, password = job
+    try:
+        return dispatch_parse(pdf_path, bank, password)
+    except Exception as e:
+        print(f"Failed batch job {pdf_path}: {e}", file=sys.stderr)
+        return {"path": pdf_path, "error": str(e)}
+
+
+def dispatch_batch(
+    jobs: List[Tuple[str, str, str]], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Parses many (pdf_path, bank, password) jobs in one process pool.\n
+    Returns one payload per job, in order; a failed job yields {"path", "error"}
+    instead of aborting the batch.
+    """
+    if len(jobs) < 2:
+        return [_dispatch_job(job) for job in jobs]
+
+    # Workers keep their _load_bank cache and imported bank modules between jobs
+    with _batch_pool(max_workers) as pool:
+        return list(pool.map(_dispatch_job, jobs))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("pdf_path", help="Path to the PDF file")
+    parser.add_argument("pdf_path", nargs="?", help="Path to the PDF file")
     parser.add_argument(
         "--bank", help="Bank name (e.g., zenith, first-bank)", default=None
     )
     parser.add_argument("--password", help="Password for encrypted PDF", default=None)
+    parser.add_argument(
+        "--batch",
+        help="JSON manifest: a list of {path, bank, password} objects",
+        default=None,
+    )
     args = parser.parse_args()
 
+    if args.batch:
+        try:
+            with open(args.batch) as f:
+                manifest = json.load(f)
+            jobs = [
+                (job["path"], job.get("bank") or "", job.get("password") or "")
+                for job in manifest
+            ]
+            print(json.dumps(dispatch_batch(jobs), indent=2))
+        except Exception as e:
+            print(f"Unexpected error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
+    if not args.pdf_path:
+        parser.error("pdf_path is required unless --batch is given")
+
     try:
         result = dispatch_parse(args.pdf_path, args.bank, args.password)
         print(json.dumps(result, indent=2))
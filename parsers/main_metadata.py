@@ -1,16 +1,23 @@
 # parsers/main_metadata_extractor.py
 import re
-import pdfplumber
+from functools import lru_cache
 from typing import Dict, Optional, List
 
-from utils import to_float
+from utils import to_float, first_page_text, strptime_first
 
-RX_MONEY = re.compile(r"(?:₦|NGN)?\s?[-\d,]+\.\d{2}")
+# Group 1 is the bare amount, without the currency prefix
+RX_MONEY = re.compile(r"(?:₦|NGN)?\s?([-\d,]+\.\d{2})")
+COMMA_DEL = str.maketrans("", "", ",")
 RX_DATE_ISO = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
 RX_DATE_DMY = re.compile(
     r"\b\d{2}[/-][A-Za-z]{3}[/-]\d{4}\b|\b\d{2}\s[A-Za-z]{3}\s\d{4}\b"
 )  # 01-Mar-2025 | 01 Mar 2025
 RX_DATE_DSL = re.compile(r"\b\d{2}[/-]\d{2}[/-]\d{4}\b")  # 01/03/2025 or 01-03-2025
+# All three in one pass; the group that matched is in lastgroup
+RX_DATE_ANY = re.compile(
+    f"(?P<iso>{RX_DATE_ISO.pattern})|(?P<dmy>{RX_DATE_DMY.pattern})"
+    f"|(?P<dsl>{RX_DATE_DSL.pattern})"
+)
 
 LABELS = {
     "bank": [
@@ -71,9 +78,37 @@ LABELS = {
 }
 
 
-def _find_first_label_line(text: str, labels: list[str]) -> Optional[str]:
-    for lbl in labels:
-        m = re.search(rf"{re.escape(lbl)}\s*[:\uFF1A]?\s*(.+)", text, re.IGNORECASE)
+# Per-field labels, lower-cased and de-duplicated in LABELS order: labels that differ
+# only in case are redundant under IGNORECASE.
+_FIELD_LABELS: Dict[str, List[str]] = {
+    field: list(dict.fromkeys(lbl.lower() for lbl in labels))
+    for field, labels in LABELS.items()
+    if field != "bank"
+}
+
+# One compiled "<label>: value" pattern per label, built once at import
+LABEL_RX: Dict[str, List[re.Pattern]] = {
+    field: [
+        re.compile(rf"{re.escape(lbl)}\s*[:\uFF1A]?\s*(.+)", re.IGNORECASE)
+        for lbl in labels
+    ]
+    for field, labels in _FIELD_LABELS.items()
+}
+
+
+# extract_metadata looks up a dozen fields in the same page text; lower-case it once
+_lower_text = lru_cache(maxsize=2)(str.lower)
+
+
+def _find_first_label_line(text: str, field: str) -> Optional[str]:
+    # Python's re has no multi-literal scan, so one alternation over all labels is
+    # no faster than the loop (and would pick the leftmost label, not the first in
+    # LABELS order). A plain substring test skips the regex for absent labels.
+    text_lower = _lower_text(text)
+    for lbl, rx in zip(_FIELD_LABELS[field], LABEL_RX[field]):
+        if lbl not in text_lower:
+            continue
+        m = rx.search(text)
         if m:
             return m.group(1).strip()
     return None
@@ -83,54 +118,65 @@ def _first_money(line: Optional[str]) -> Optional[str]:
     if not line:
         return None
     m = RX_MONEY.search(line)
-    return m.group(0).replace("NGN", "").replace("₦", "").strip() if m else None
+    return m.group(1) if m else None
 
 
 def _first_date(line: Optional[str]) -> Optional[str]:
     if not line:
         return None
-    for rx in (RX_DATE_ISO, RX_DATE_DMY, RX_DATE_DSL):
-        m = rx.search(line)
-        if m:
-            return _norm_date(m.group(0))
-    return None
+    m = RX_DATE_ANY.search(line)
+    if not m:
+        return None
+    # The leftmost date wins unless a higher-priority kind (ISO, then DMY) occurs
+    # further along, matching the previous one-pattern-at-a-time search
+    if m.lastgroup != "iso":
+        later = RX_DATE_ISO.search(line, m.start() + 1)
+        if not later and m.lastgroup == "dsl":
+            later = RX_DATE_DMY.search(line, m.start() + 1)
+        if later:
+            m = later
+    return _norm_date(m.group(0))
+
+
+META_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d %b %Y", "%d-%b-%Y")
+# (length, third character) -> the format the ordered scan above would pick
+META_DATE_GUESSES = {
+    **{(10, d): "%Y-%m-%d" for d in "0123456789"},
+    (10, "/"): "%d/%m/%Y",
+    (10, "-"): "%d-%m-%Y",
+    (11, " "): "%d %b %Y",
+    (11, "-"): "%d-%b-%Y",
+}
 
 
 def _norm_date(s: str) -> str:
     # Normalize to YYYY-MM-DD when possible; otherwise return original.
     # Accepts: 2025-03-01, 01/03/2025, 01-03-2025, 01 Mar 2025, 01-Mar-2025
     try:
-        from datetime import datetime
-
-        for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d %b %Y", "%d-%b-%Y"):
-            try:
-                return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                pass
+        dt = strptime_first(s, META_DATE_FORMATS, META_DATE_GUESSES)
+        if dt is not None:
+            return dt.strftime("%Y-%m-%d")
     except Exception:
         pass
     return s
 
 
-def _peek_bank(text: str) -> Optional[str]:
-    # quick bank guess by banner words on header/footer
-    head = "\n".join(text.splitlines()[:20]).upper()
-    for b in LABELS["bank"]:
-        if b in head:
-            return b
-    return None
+def _peek_bank(head_upper: str) -> Optional[str]:
+    # quick bank guess by banner words on header/footer (first label in LABELS order
+    # wins, so this stays a substring scan rather than a leftmost-match alternation)
+    return next((b for b in LABELS["bank"] if b in head_upper), None)
 
 
 def _period(text: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
-    raw = _find_first_label_line(text, LABELS["period"])
+    raw = _find_first_label_line(text, "period")
     if raw:
         # Example: "01-Mar-2025 TO 12-Aug-2025" | "01/03/2025 to 12/08/2025"
         m = re.search(r"(.+?)\s+(?:to|TO|-|–)\s+(.+)", raw)
         if m:
             return _norm_date(m.group(1).strip()), _norm_date(m.group(2).strip()), raw
     # Fallback to separate labels
-    start = _first_date(_find_first_label_line(text, LABELS["start_date"]))
-    end = _first_date(_find_first_label_line(text, LABELS["end_date"]))
+    start = _first_date(_find_first_label_line(text, "start_date"))
+    end = _first_date(_find_first_label_line(text, "end_date"))
     return start, end, raw
 
 
@@ -151,47 +197,44 @@ def extract_metadata(path: str) -> Dict:
         "raw_header": None,
     }
 
-    with pdfplumber.open(path) as pdf:
-        if not pdf.pages:
-            return meta
-        first = pdf.pages[0]
-        text = (first.extract_text() or "").strip()
-        meta["raw_header"] = "\n".join(
-            text.splitlines()[:60]
-        )  # keep small slice for debug
-        meta["bank"] = _peek_bank(text)
-
-        # Simple keyed fields (same line after label)
-        meta["account_name"] = _find_first_label_line(text, LABELS["account_name"])
-        meta["account_number"] = (
-            (_find_first_label_line(text, LABELS["account_number"]) or "")
-            .replace(" ", "")
-            .replace(":", "")
-        )
-        meta["currency"] = _find_first_label_line(text, LABELS["currency"])
-        meta["account_type"] = _find_first_label_line(text, LABELS["account_type"])
-
-        start, end, raw_period = _period(text)
-        if start:
-            meta["start_date"] = start
-        if end:
-            meta["end_date"] = end
-        meta["period_text"] = raw_period
-
-        meta["date_printed"] = _first_date(
-            _find_first_label_line(text, LABELS["date_printed"])
-        )
+    # Page 1 text is shared with the detectors and parsers (cached per file version)
+    text = first_page_text(path)
+    if text is None:
+        return meta
+    text = text.strip()
+    lines = text.splitlines()
+    meta["raw_header"] = "\n".join(lines[:60])  # keep small slice for debug
+    meta["bank"] = _peek_bank("\n".join(lines[:20]).upper())
+
+    # Simple keyed fields (same line after label)
+    meta["account_name"] = _find_first_label_line(text, "account_name")
+    meta["account_number"] = (
+        (_find_first_label_line(text, "account_number") or "")
+        .replace(" ", "")
+        .replace(":", "")
+    )
+    meta["currency"] = _find_first_label_line(text, "currency")
+    meta["account_type"] = _find_first_label_line(text, "account_type")
 
-        # balances
-        meta["opening_balance"] = _first_money(
-            _find_first_label_line(text, LABELS["opening_balance"])
-        )
-        meta["closing_balance"] = _first_money(
-            _find_first_label_line(text, LABELS["closing_balance"])
-        )
-        meta["current_balance"] = _first_money(
-            _find_first_label_line(text, LABELS["current_balance"])
-        )
+    start, end, raw_period = _period(text)
+    if start:
+        meta["start_date"] = start
+    if end:
+        meta["end_date"] = end
+    meta["period_text"] = raw_period
+
+    meta["date_printed"] = _first_date(_find_first_label_line(text, "date_printed"))
+
+    # balances
+    meta["opening_balance"] = _first_money(
+        _find_first_label_line(text, "opening_balance")
+    )
+    meta["closing_balance"] = _first_money(
+        _find_first_label_line(text, "closing_balance")
+    )
+    meta["current_balance"] = _first_money(
+        _find_first_label_line(text, "current_balance")
+    )
 
     # final cleanups
     meta["account_number"] = (meta["account_number"] or "").strip() or None
@@ -213,7 +256,11 @@ def _is_nuban_10_digits(acct: Optional[str]) -> bool:
 def _money_to_float(s: Optional[str]) -> float:
     if not s:
         return 0.0
-    return float(s.replace("NGN", "").replace("₦", "").replace(",", "").strip())
+    try:
+        # Values from _first_money are bare "1,234.56" amounts
+        return float(s.translate(COMMA_DEL))
+    except ValueError:
+        return float(s.replace("NGN", "").replace("₦", "").replace(",", "").strip())
 
 
 def verify_legitimacy(
@@ -246,21 +293,15 @@ def verify_legitimacy(
     )
 
     # 3. Running balance monotonic math (when BALANCE present)
+    # (no directional check; we don't know DR/CR mapping exactly across banks)
+    balances = [r["BALANCE"] for r in transactions if r.get("BALANCE")]
     math_ok = True
-    prev_bal = None
-    for i, r in enumerate(transactions):
-        bal = r.get("BALANCE")
-        if not bal:
-            continue
+    for bal in balances:
         try:
-            balf = float(bal.replace(",", ""))
+            float(bal.replace(",", ""))
         except:
             math_ok = False
             break
-        if prev_bal is not None:
-            # optional directional check; we don't know DR/CR mapping exactly across banks
-            pass
-        prev_bal = balf
     checks.append(
         {
             "id": "balance_numeric",
@@ -274,17 +315,9 @@ def verify_legitimacy(
     opening = _money_to_float(meta.get("opening_balance"))
     closing = _money_to_float(meta.get("closing_balance"))
     if transactions:
-        first_bal = None
-        last_bal = None
-        # grab first non-empty BALANCE and last non-empty BALANCE
-        for r in transactions:
-            if r.get("BALANCE"):
-                first_bal = float(r["BALANCE"].replace(",", ""))
-                break
-        for r in reversed(transactions):
-            if r.get("BALANCE"):
-                last_bal = float(r["BALANCE"].replace(",", ""))
-                break
+        # first non-empty BALANCE and last non-empty BALANCE
+        first_bal = float(balances[0].replace(",", "")) if balances else None
+        last_bal = float(balances[-1].replace(",", "")) if balances else None
         comp_ok = True
         reasons = {}
         if first_bal is not None and opening and abs(first_bal - opening) > 0.01:
@@ -1,182 +1,190 @@
 import sys
 import re
-import pdfplumber
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from utils import *
 
+# Text-fallback rows start with a dd/mm/yyyy-style date; splitting before each such
+# line yields one block per row (the first block may be lines preceding any date)
+TXN_BLOCK_SPLIT_RE = re.compile(r"\n(?=\d{2}[-/.]\d{2}[-/.]\d{4})")
+
+PageContent = Tuple[List[List[List[str]]], Optional[str]]
+
+
+def _page_content(page, page_num: int, path: Optional[str] = None) -> PageContent:
+    """
+    Extract one page's tables, or its text when it has none, then release the
+    page's cached layout objects. Given the path, page 1's text comes from the
+    first_page_text cache the detector and metadata share.
+    """
+    print(f"(main parser): Processing page {page_num}", file=sys.stderr)
+    tables = page.extract_tables(MAIN_TABLE_SETTINGS)
+    if tables:
+        text = None
+    elif path is not None and page_num == 1:
+        text = first_page_text(path)
+    else:
+        text = page.extract_text()
+    page.close()
+    return tables, text
+
+
+def _cell(row: List[str], idx: Optional[int]) -> str:
+    """
+    row[idx], or "" when the table has no such column (idx is None) or the row
+    is shorter than the headers.
+    """
+    return row[idx] if idx is not None and idx < len(row) else ""
+
 
 def main_parse(path: str) -> List[Dict[str, str]]:
     transactions = []
     global_headers = None
 
     try:
-        with pdfplumber.open(path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                print(f"(main parser): Processing page {page_num}", file=sys.stderr)
-                # Table extraction settings
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                    "text_tolerance": 1,
-                }
-                tables = page.extract_tables(table_settings)
-
-                if tables:
-                    for table in tables:
-                        if not table or len(table) < 1:
-                            continue
-
-                        first_row = table[0]
-                        normalized_first_row = [
-                            normalize_column_name(h) if h else "" for h in first_row
-                        ]
-                        is_header_row = any(
-                            h in FIELD_MAPPINGS for h in normalized_first_row if h
-                        )
+        with open_pdf(path) as pdf:
+            page_count = len(pdf.pages)
+            parallel = page_run_workers(page_count) > 1
+            if not parallel:
+                page_contents = [
+                    _page_content(page, page_num, path)
+                    for page_num, page in enumerate(pdf.pages, 1)
+                ]
+
+        if parallel:
+            # Extraction is independent per page; the header/balance handling below
+            # still runs in page order
+            page_contents = map_page_runs(path, page_count, _page_content)
+
+        for page_num, (tables, text) in enumerate(page_contents, 1):
+            if tables:
+                for table in tables:
+                    if not table or len(table) < 1:
+                        continue
+
+                    first_row = table[0]
+                    normalized_first_row = [
+                        normalize_column_name(h) if h else "" for h in first_row
+                    ]
+                    is_header_row = any(
+                        h in FIELD_MAPPINGS for h in normalized_first_row if h
+                    )
 
-                        if not is_header_row:
-                            # Skip summary-like 2-column tables without printing
-                            if len(first_row) <= 2:
-                                continue
+                    if not is_header_row:
+                        # Skip summary-like 2-column tables without printing
+                        if len(first_row) <= 2:
+                            continue
 
-                        if is_header_row and not global_headers:
-                            # Store headers from the first page with headers
-                            global_headers = normalized_first_row
+                    if is_header_row and not global_headers:
+                        # Store headers from the first page with headers
+                        global_headers = normalized_first_row
 
+                        print(
+                            f"Stored global headers: {global_headers}",
+                            file=sys.stderr,
+                        )
+                        # Process data rows (skip header row)
+                        data_rows = table[1:]
+                    elif is_header_row and global_headers:
+                        # Check if first row matches global_headers
+                        if normalized_first_row == global_headers:
                             print(
-                                f"Stored global headers: {global_headers}",
+                                f"Skipping repeated header row on page {page_num}",
                                 file=sys.stderr,
                             )
-                            # Process data rows (skip header row)
-                            data_rows = table[1:]
-                        elif is_header_row and global_headers:
-                            # Check if first row matches global_headers
-                            if normalized_first_row == global_headers:
-                                print(
-                                    f"Skipping repeated header row on page {page_num}",
-                                    file=sys.stderr,
-                                )
-                                data_rows = table[1:]  # Skip header row
-                            else:
-                                # Treat as data if different headers
-                                print(
-                                    f"Different headers on page {page_num}, treating as data",
-                                    file=sys.stderr,
-                                )
-                                data_rows = table
+                            data_rows = table[1:]  # Skip header row
                         else:
-                            # No header row, use global_headers
-                            data_rows = table
-
-                        if not global_headers:
+                            # Treat as data if different headers
                             print(
-                                f"(main parser): No headers found by page {page_num}, skipping table",
+                                f"Different headers on page {page_num}, treating as data",
                                 file=sys.stderr,
                             )
-                            continue
-
-                        has_amount = "AMOUNT" in global_headers
-                        balance_idx = (
-                            global_headers.index("BALANCE")
-                            if "BALANCE" in global_headers
-                            else -1
+                            data_rows = table
+                    else:
+                        # No header row, use global_headers
+                        data_rows = table
+
+                    if not global_headers:
+                        print(
+                            f"(main parser): No headers found by page {page_num}, skipping table",
+                            file=sys.stderr,
+                        )
+                        continue
+
+                    prev_balance = None
+
+                    # Column positions are fixed for the table; resolve them once
+                    # (a repeated header name keeps its last column, as a dict would)
+                    col = {h: i for i, h in enumerate(global_headers)}
+                    txn_idx = col.get("TXN_DATE", col.get("VAL_DATE"))
+                    val_idx = col.get("VAL_DATE", col.get("TXN_DATE"))
+                    ref_idx = col.get("REFERENCE")
+                    remarks_idx = col.get("REMARKS")
+                    bal_idx = col.get("BALANCE")
+                    amount_idx = col.get("AMOUNT")
+                    debit_idx = col.get("DEBIT")
+                    credit_idx = col.get("CREDIT")
+
+                    for row in data_rows:
+                        # DEBIT/CREDIT are always filled in below
+                        standardized_row = STANDARDIZED_ROW.copy()
+                        standardized_row["TXN_DATE"] = normalize_date(
+                            _cell(row, txn_idx)
+                        )
+                        standardized_row["VAL_DATE"] = normalize_date(
+                            _cell(row, val_idx)
+                        )
+                        standardized_row["REFERENCE"] = _cell(row, ref_idx)
+                        standardized_row["REMARKS"] = _cell(row, remarks_idx)
+                        standardized_row["BALANCE"] = normalize_money(
+                            _cell(row, bal_idx)
                         )
-                        prev_balance = None
-
-                        for row in data_rows:
-                            if len(row) < len(global_headers):
-                                row.extend([""] * (len(global_headers) - len(row)))
-
-                            row_dict = {
-                                global_headers[i]: row[i] if i < len(row) else ""
-                                for i in range(len(global_headers))
-                            }
-
-                            standardized_row = {
-                                "TXN_DATE": normalize_date(
-                                    row_dict.get(
-                                        "TXN_DATE", row_dict.get("VAL_DATE", "")
-                                    )
-                                ),
-                                "VAL_DATE": normalize_date(
-                                    row_dict.get(
-                                        "VAL_DATE", row_dict.get("TXN_DATE", "")
-                                    )
-                                ),
-                                "REFERENCE": row_dict.get("REFERENCE", ""),
-                                "REMARKS": row_dict.get("REMARKS", ""),
-                                "DEBIT": "",
-                                "CREDIT": "",
-                                "BALANCE": normalize_money(row_dict.get("BALANCE", "")),
-                                "Check": "",
-                                "Check 2": "",
-                            }
-
-                            if has_amount and balance_idx != -1:
-                                amount = to_float(row_dict.get("AMOUNT", ""))
-                                current_balance = to_float(row_dict.get("BALANCE", ""))
-
-                                if prev_balance is not None:
-                                    if current_balance < prev_balance:
-                                        standardized_row["DEBIT"] = f"{abs(amount):.2f}"
-                                        standardized_row["CREDIT"] = "0.00"
-                                    else:
-                                        standardized_row["DEBIT"] = "0.00"
-                                        standardized_row["CREDIT"] = (
-                                            f"{abs(amount):.2f}"
-                                        )
+
+                        if amount_idx is not None and bal_idx is not None:
+                            amount = to_float(_cell(row, amount_idx))
+                            current_balance = to_float(_cell(row, bal_idx))
+
+                            if prev_balance is not None:
+                                if current_balance < prev_balance:
+                                    standardized_row["DEBIT"] = f"{abs(amount):.2f}"
+                                    standardized_row["CREDIT"] = "0.00"
                                 else:
                                     standardized_row["DEBIT"] = "0.00"
-                                    standardized_row["CREDIT"] = "0.00"
-                                prev_balance = current_balance
+                                    standardized_row["CREDIT"] = f"{abs(amount):.2f}"
                             else:
-                                standardized_row["DEBIT"] = normalize_money(
-                                    row_dict.get("DEBIT", "0.00")
-                                )
-                                standardized_row["CREDIT"] = normalize_money(
-                                    row_dict.get("CREDIT", "0.00")
-                                )
-                                prev_balance = (
-                                    to_float(standardized_row["BALANCE"])
-                                    if standardized_row["BALANCE"]
-                                    else prev_balance
-                                )
-
-                            transactions.append(standardized_row)
-                else:
-                    # Fallback: Extract text if no tables found
-                    print(
-                        f"No tables found on page {page_num}, attempting text extraction ",
-                        file=sys.stderr,
-                    )
-                    text = page.extract_text()
-                    if text and global_headers:
-                        lines = text.split("\n")
-                        current_row = []
-                        for line in lines:
-                            if re.match(r"^\d{2}[-/.]\d{2}[-/.]\d{4}", line):
-                                if current_row:
-                                    transactions.append(
-                                        parse_text_row(current_row, global_headers)
-                                    )
-                                current_row = [line]
-                            else:
-                                current_row.append(line)
-                        if current_row:
-                            transactions.append(
-                                parse_text_row(current_row, global_headers)
+                                standardized_row["DEBIT"] = "0.00"
+                                standardized_row["CREDIT"] = "0.00"
+                            prev_balance = current_balance
+                        else:
+                            # A missing column normalizes to "0.00" either way
+                            standardized_row["DEBIT"] = normalize_money(
+                                _cell(row, debit_idx)
+                            )
+                            standardized_row["CREDIT"] = normalize_money(
+                                _cell(row, credit_idx)
+                            )
+                            prev_balance = (
+                                to_float(standardized_row["BALANCE"])
+                                if standardized_row["BALANCE"]
+                                else prev_balance
                             )
 
-        return calculate_checks(
-            [t for t in transactions if t["TXN_DATE"] or t["VAL_DATE"]]
-        )
+                        # Undated rows are dropped here instead of in a final pass
+                        if standardized_row["TXN_DATE"] or standardized_row["VAL_DATE"]:
+                            transactions.append(standardized_row)
+            else:
+                # Fallback: Extract text if no tables found
+                print(
+                    f"No tables found on page {page_num}, attempting text extraction ",
+                    file=sys.stderr,
+                )
+                if text and global_headers:
+                    for block in TXN_BLOCK_SPLIT_RE.split(text):
+                        text_row = parse_text_row(block.split("\n"), global_headers)
+                        if text_row["TXN_DATE"] or text_row["VAL_DATE"]:
+                            transactions.append(text_row)
+
+        return calculate_checks(transactions)
 
     except Exception as e:
         print(f"Error processing PDF: {e}", file=sys.stderr)
@@ -1,13 +1,26 @@
+import logging
+import mmap
+import os
 import sys
 import re
-from typing import List, Dict, Tuple, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Dict, Mapping, Tuple, Optional, TypeVar
 from datetime import datetime
-from PyPDF2 import PdfReader, PdfWriter
+import pdfplumber
+from PyPDF2 import PdfReader
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 # from app.parsers.models import TransactionRow
 
+logger = logging.getLogger(__name__)
+
 TOLERANCE = 0.01
+# The balance check runs on integer cents, so the tolerance is kept in cents too
+TOLERANCE_CENTS = round(TOLERANCE * 100)
 
 # ------------------------
 # CONSTANTS / MAPPINGS
@@ -150,17 +163,22 @@ MAIN_TABLE_SETTINGS = {
     "text_tolerance": 1,
 }
 
-STANDARDIZED_ROW = {
-    "TXN_DATE": "",
-    "VAL_DATE": "",
-    "REFERENCE": "",
-    "REMARKS": "",
-    "DEBIT": "0.00",
-    "CREDIT": "0.00",
-    "BALANCE": "0.00",
-    "Check": "",
-    "Check 2": "",
-}
+# Row template shared by every parser: take STANDARDIZED_ROW.copy() (a plain dict).
+# The read-only view stops a parser from editing the defaults in place; copying it
+# costs the same as copying the dict.
+STANDARDIZED_ROW: Mapping[str, str] = MappingProxyType(
+    {
+        "TXN_DATE": "",
+        "VAL_DATE": "",
+        "REFERENCE": "",
+        "REMARKS": "",
+        "DEBIT": "0.00",
+        "CREDIT": "0.00",
+        "BALANCE": "0.00",
+        "Check": "",
+        "Check 2": "",
+    }
+)
 
 # ------------------------
 # COMPILED REGEX (shared)
@@ -173,23 +191,52 @@ RX_ENDS_MONTH_DASH = re.compile(
     r"^\s*\d{2}-[A-Z]{3}-\s*$"
 )  # "30-JAN-" (optional spaces around)
 RX_MULTI_WS = re.compile(r"\s+")
+RX_NON_NUMERIC = re.compile(r"[^\d.-]")
+RX_MONEY_CLUTTER = re.compile(r"[^\d.,-]")
+# normalize_date clean-up steps
+RX_NON_DATE_ROW = re.compile(r"(?i)^(total|closing|opening|balance|subtotal)")
+RX_PAGE_SUFFIX = re.compile(r"[Pp]age[\s\-]?\d*$")  # "Page", "Page 2", "Page-4"
+RX_DIGIT_GAP = re.compile(r"(?<=\d)\s+(?=\d)")  # "2 0 2 5"
+# One pass over: spacing around "-", "/" or ":" (group 1), whitespace between digits
+# (group 2), any other whitespace run; see _date_spacing
+RX_DATE_SPACING = re.compile(r"\s*([-/:])\s*|((?<=\d)\s+(?=\d))|\s+")
+# "01Jan,2025"
+RX_DAY_MON_COMMA_YEAR = re.compile(r"^(\d{1,2})([A-Za-z]{3,9}),(\d{4})$")
+RX_LINE_BREAKS = re.compile(r"[\r\n]+")
+RX_DATE_SEP = re.compile(r"[-/]")
+RX_TRUNCATED_YEAR = re.compile(r"^\d{3}-\d{2}-\d{2}$")  # "024-12-09"
+RX_DIGIT = re.compile(r"\d")
+# Text-fallback rows start with a dd/mm/yyyy-style date
+RX_DATE_LINE = re.compile(r"^\d{2}[-/.]\d{2}[-/.]\d{4}")
+# Deletes every character to_float keeps; anything left over needs the regex clean-up
+NUMERIC_CHARS_DEL = str.maketrans("", "", "0123456789.-")
 
 
 # ------------------------
 # NUMERIC / MONEY HELPERS
 # ------------------------
+# Amounts such as "0.00" and recurring fees repeat across rows and parsers; each
+# distinct string is parsed (and warned about) once per process
+@lru_cache(maxsize=4096)
 def to_float(value: str) -> float:
     value = value.strip() if value else ""
     if not value or value in {"-", "", "--"}:
         return 0.0
     try:
-        cleaned = re.sub(r"[^\d.-]", "", value)
+        # Fast path for the usual "1,234.56": drop the commas and check nothing else
+        # is left; currency signs, spaces, CR/DR etc. fall back to the regex.
+        cleaned = value.replace(",", "")
+        if cleaned.translate(NUMERIC_CHARS_DEL):
+            cleaned = RX_NON_NUMERIC.sub("", value)
         return float(cleaned)
     except ValueError:
-        print(f"Warning: Could not parse number '{value}'", file=sys.stderr)
+        logger.warning("Warning: Could not parse number '%s'", value)
         return 0.0
 
 
+# Money cells repeat heavily ("0.00", "----", recurring fees); like to_float and
+# normalize_date, each distinct string is cleaned once per process
+@lru_cache(maxsize=8192)
 def clean_money(s: Optional[str]) -> str:
     """
     Normalizes placeholders like '----', '—', '' to '0.00',
@@ -211,7 +258,7 @@ def clean_money(s: Optional[str]) -> str:
 
     # Remove any non-numeric clutter except decimal and minus
     if not RX_AMOUNT_LIKE.match(t):
-        t = re.sub(r"[^\d.,-]", "", t)
+        t = RX_MONEY_CLUTTER.sub("", t)
 
     try:
         value = to_float(t)
@@ -239,191 +286,361 @@ def join_date_fragments(s: str) -> str:
     return RX_MULTI_WS.sub("", s)
 
 
+# Same answers as the RX_TWO_DIGIT_YEAR / RX_FOUR_DIGIT_YEAR / RX_ENDS_MONTH_DASH
+# regexes (\d is exactly str.isdecimal), without a regex call per cell
 def is_two_digit_year(s: str) -> bool:
-    return bool(RX_TWO_DIGIT_YEAR.fullmatch((s or "").strip()))
+    ss = (s or "").strip()
+    return len(ss) == 2 and ss.isdecimal()
 
 
 def is_year_only(s: str) -> bool:
     ss = (s or "").strip()
-    return bool(RX_TWO_DIGIT_YEAR.fullmatch(ss) or RX_FOUR_DIGIT_YEAR.fullmatch(ss))
+    return len(ss) in (2, 4) and ss.isdecimal()
 
 
 def ends_with_month_dash(s: str) -> bool:
-    return bool(RX_ENDS_MONTH_DASH.fullmatch((s or "").strip()))
+    ss = (s or "").strip()
+    month = ss[3:6]
+    return (
+        len(ss) == 7
+        and ss[2] == ss[6] == "-"
+        and ss[:2].isdecimal()
+        and month.isascii()
+        and month.isalpha()
+        and month.isupper()
+    )
+
+
+DATE_FORMATS = (
+    "%d-%b-%Y",
+    "%d-%b-%y",
+    "%d/%m/%Y",
+    "%d/%m/%y",
+    "%d-%m-%Y",
+    "%d-%m-%y",
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d %b %Y",
+    "%d.%m.%Y",
+    "%d.%m.%y",
+    "%d %B %Y",
+    "%d-%B-%Y",
+    "%d/%b/%y",
+)
+# First guess per date shape, keyed by (length, third character). Each entry is the
+# format the ordered DATE_FORMATS scan would settle on for strings of that shape (the
+# formats before it need other separators, letters or a 4-digit year), so trying it
+# first never changes the result; a miss or a failed guess falls back to the scan.
+DATE_FORMAT_GUESSES: Dict[Tuple[int, str], str] = {
+    **{(10, d): "%Y-%m-%d" for d in "0123456789"},
+    **{(19, d): "%Y-%m-%dT%H:%M:%S" for d in "0123456789"},
+    (10, "/"): "%d/%m/%Y",
+    (8, "/"): "%d/%m/%y",
+    (10, "-"): "%d-%m-%Y",
+    (8, "-"): "%d-%m-%y",
+    (11, "-"): "%d-%b-%Y",
+    (9, "-"): "%d-%b-%y",
+    (11, " "): "%d %b %Y",
+    (10, "."): "%d.%m.%Y",
+    (8, "."): "%d.%m.%y",
+}
 
 
+# Fixed-width formats built straight from their fields, without strptime:
+# (length, separator positions, year, month and day slices). The separator is fmt[2].
+DATE_LAYOUTS: Dict[str, Tuple[int, Tuple[int, int], slice, slice, slice]] = {
+    "%Y-%m-%d": (10, (4, 7), slice(0, 4), slice(5, 7), slice(8, 10)),
+    "%d/%m/%Y": (10, (2, 5), slice(6, 10), slice(3, 5), slice(0, 2)),
+    "%d-%m-%Y": (10, (2, 5), slice(6, 10), slice(3, 5), slice(0, 2)),
+    "%d.%m.%Y": (10, (2, 5), slice(6, 10), slice(3, 5), slice(0, 2)),
+    "%d-%b-%Y": (11, (2, 6), slice(7, 11), slice(3, 6), slice(0, 2)),
+    "%d %b %Y": (11, (2, 6), slice(7, 11), slice(3, 6), slice(0, 2)),
+    "%d-%b-%y": (9, (2, 6), slice(7, 9), slice(3, 6), slice(0, 2)),
+}
+# %b as strptime reads it in the default C locale (matched case-insensitively)
+MONTH_ABBRS = {
+    m: i
+    for i, m in enumerate("jan feb mar apr may jun jul aug sep oct nov dec".split(), 1)
+}
+
+
+def _layout_date(s: str, fmt: str) -> Optional[datetime]:
+    """
+    datetime.strptime(s, fmt) for a date that exactly fills one of DATE_LAYOUTS
+    (zero-padded digits, 3-letter month); None when fmt has no layout or s does
+    not fit it.
+    """
+    layout = DATE_LAYOUTS.get(fmt)
+    if layout is None:
+        return None
+    length, (i, j), year, month, day = layout
+    if len(s) != length or not s.isascii():
+        return None
+    sep = fmt[2]
+    if s[i] != sep or s[j] != sep:
+        return None
+    y, m, d = s[year], s[month], s[day]
+    if not (y.isdigit() and d.isdigit()):
+        return None
+    if fmt[4] == "b":
+        month_num = MONTH_ABBRS.get(m.lower())
+        if month_num is None:
+            return None
+    elif m.isdigit():
+        month_num = int(m)
+    else:
+        return None
+    year_num = int(y)
+    if len(y) == 2:
+        # strptime's %y pivot: 69-99 -> 1900s, 00-68 -> 2000s
+        year_num += 2000 if year_num <= 68 else 1900
+    try:
+        return datetime(year_num, month_num, int(d))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _format_separators(formats: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """(fmt, separators it needs literally); strptime cannot match without them."""
+    return tuple(
+        (fmt, "".join({c for c in re.sub(r"%.", "", fmt) if c in "-/.:"}))
+        for fmt in formats
+    )
+
+
+def strptime_first(
+    s: str,
+    formats: Tuple[str, ...] = DATE_FORMATS,
+    guesses: Dict[Tuple[int, str], str] = DATE_FORMAT_GUESSES,
+) -> Optional[datetime]:
+    """
+    Parses s with the first of formats that fits, or returns None.
+    The guess for s's shape is tried first, then formats in order, skipping any
+    whose separators do not occur in s.
+    """
+    guess = guesses.get((len(s), s[2:3]))
+    if guess is not None:
+        dt = _layout_date(s, guess)
+        if dt is not None:
+            return dt
+        try:
+            return datetime.strptime(s, guess)
+        except ValueError:
+            pass
+    for fmt, seps in _format_separators(formats):
+        if fmt == guess or not all(c in s for c in seps):
+            continue
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _date_spacing(m: "re.Match[str]") -> str:
+    """RX_DATE_SPACING replacement: the bare separator, "" between digits, else " "."""
+    group = m.lastindex
+    if group == 1:
+        return m.group(1)
+    return "" if group == 2 else " "
+
+
+# Statements repeat the same few dates across many rows; each distinct string is
+# parsed (and warned about) once per process
+@lru_cache(maxsize=8192)
 def normalize_date(date_str: str) -> str:
     if not date_str:
         return ""
 
+    # Already-ISO cells (often the output of an earlier pass) come back unchanged;
+    # fromisoformat accepts exactly the valid ones and is far cheaper than the rest
+    if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+        try:
+            datetime.fromisoformat(date_str)
+            return date_str
+        except ValueError:
+            pass
+
+    # Clean fixed-width numeric dates (ISO "2025-03-01", "01/03/2025", ...) need
+    # none of the clean-up below
+    guess = DATE_FORMAT_GUESSES.get((len(date_str), date_str[2:3]))
+    if guess is not None:
+        dt = _layout_date(date_str, guess)
+        if dt is not None:
+            return dt.strftime("%Y-%m-%d")
+
     # Skip non-date rows like totals/closing balance
-    if re.match(r"(?i)^(total|closing|opening|balance|subtotal)", date_str.strip()):
+    if RX_NON_DATE_ROW.match(date_str.strip()):
         return ""
 
     s = date_str.strip()
+    # Every DATE_FORMATS entry needs digits; text-only cells ("Balance B/F", footer
+    # lines) skip the format scans and fall through to the warning
+    has_digits = RX_DIGIT.search(s) is not None
 
     # Remove trailing 'Page', 'Page 2', 'Page-4', etc.
-    s = re.sub(r"[Pp]age[\s\-]?\d*$", "", s).strip()
-
-    # Normalize spacing around common separators
-    s = re.sub(r"\s*-\s*", "-", s)
-    s = re.sub(r"\s*/\s*", "/", s)
-    s = re.sub(r"\s*:\s*", ":", s)
-    s = re.sub(r"\s+", " ", s)
+    s = RX_PAGE_SUFFIX.sub("", s).strip()
 
-    # Collapse spaces occurring *between digits* (e.g. '2 0 2 5' -> '2025')
-    s = re.sub(r"(?<=\d)\s+(?=\d)", "", s)
+    # Normalize spacing around common separators, single-space other whitespace and
+    # collapse spaces occurring *between digits* (e.g. '2 0 2 5' -> '2025')
+    s = RX_DATE_SPACING.sub(_date_spacing, s)
 
     # Handle formats like '01Jan,2025' or '1Jan,2025'
-    m = re.match(r"^(\d{1,2})([A-Za-z]{3,9}),(\d{4})$", s)
+    m = RX_DAY_MON_COMMA_YEAR.match(s)
     if m:
         day, month, year = m.groups()
         s = f"{day} {month} {year}"
 
     # If there are line breaks, first try a "hard collapse" (good for '06/24/202\n5')
     if "\n" in date_str or "\r" in date_str:
-        collapsed = re.sub(r"[\r\n]+", "", s)
+        collapsed = RX_LINE_BREAKS.sub("", s)
         # Also fix digit-separated-by-spaces again after collapse
-        collapsed = re.sub(r"(?<=\d)\s+(?=\d)", "", collapsed)
+        collapsed = RX_DIGIT_GAP.sub("", collapsed)
         try:
             # Fast path: if collapsed parses, take it
-            for fmt in (
-                "%d-%b-%Y",
-                "%d-%b-%y",
-                "%d/%m/%Y",
-                "%d/%m/%y",
-                "%d-%m-%Y",
-                "%d-%m-%y",
-                "%m/%d/%Y",
-                "%m/%d/%y",
-                "%Y-%m-%d",
-                "%Y-%m-%dT%H:%M:%S",
-                "%d %b %Y",
-                "%d.%m.%Y",
-                "%d.%m.%y",
-                "%d %B %Y",
-                "%d-%B-%Y",
-                "%d/%b/%y",
-            ):
-                try:
-                    dt = datetime.strptime(collapsed, fmt)
-                    return dt.strftime("%Y-%m-%d")
-                except ValueError:
-                    pass
+            dt = strptime_first(collapsed) if has_digits else None
+            if dt is not None:
+                return dt.strftime("%Y-%m-%d")
         except Exception:
             pass
 
         # Fallback for things like '11-Dec-\n2024' -> '11-Dec-2024'
-        parts = [p.strip("- /:.") for p in re.split(r"[\r\n]+", s) if p.strip()]
+        parts = [p.strip("- /:.") for p in RX_LINE_BREAKS.split(s) if p.strip()]
         if parts:
             # If first chunk already ends with a date separator, keep it; else join with '-'
             # e.g. '11-Dec-' + '2024' => '11-Dec-2024'; '11 Dec' + '2024' => '11 Dec-2024'
-            if re.search(r"[-/]", parts[0] + "-"):
+            if RX_DATE_SEP.search(parts[0] + "-"):
                 s = "".join(parts) if parts[0].endswith(("/", "-")) else "-".join(parts)
             else:
                 s = "-".join(parts)
 
     # Fix truncated 4-digit year like '024-12-09' -> '2024-12-09'
-    if re.match(r"^\d{3}-\d{2}-\d{2}$", s):
+    if RX_TRUNCATED_YEAR.match(s):
         s = "2" + s
 
-    date_formats = [
-        "%d-%b-%Y",
-        "%d-%b-%y",
-        "%d/%m/%Y",
-        "%d/%m/%y",
-        "%d-%m-%Y",
-        "%d-%m-%y",
-        "%m/%d/%Y",
-        "%m/%d/%y",
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%d %b %Y",
-        "%d.%m.%Y",
-        "%d.%m.%y",
-        "%d %B %Y",
-        "%d-%B-%Y",
-        "%d/%b/%y",
-    ]
-
-    for fmt in date_formats:
-        try:
-            dt = datetime.strptime(s, fmt)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
+    dt = strptime_first(s) if has_digits else None
+    if dt is not None:
+        return dt.strftime("%Y-%m-%d")
 
     # If nothing matches, keep original so upstream can decide what to do.
-    print(
-        f"Warning: Could not parse date '{date_str}' (cleaned='{s}')", file=sys.stderr
-    )
+    logger.warning("Warning: Could not parse date '%s' (cleaned='%s')", date_str, s)
     return date_str
 
 
 # ------------------------
 # COLUMN / ROW HELPERS
 # ------------------------
+# Reverse of FIELD_MAPPINGS (lower-cased alias -> standard name). setdefault keeps the
+# first standard name for an alias listed twice, as the old in-order scan did.
+ALIAS_TO_STANDARD: Dict[str, str] = {}
+for _standard, _aliases in FIELD_MAPPINGS.items():
+    for _alias in _aliases:
+        ALIAS_TO_STANDARD.setdefault(_alias.lower(), _standard)
+
+
 def normalize_column_name(col: str) -> str:
     if not col:
         return ""
     col_lower = col.lower().strip()
-    for standard, aliases in FIELD_MAPPINGS.items():
-        if col_lower in [alias.lower() for alias in aliases]:
-            return standard
-    return col_lower
+    return ALIAS_TO_STANDARD.get(col_lower, col_lower)
+
+
+def _to_cents(value: str) -> int:
+    # Every row leaves one of DEBIT/CREDIT at "0.00"; skip parsing it
+    if value == "0.00":
+        return 0
+    return round(to_float(value) * 100)
 
 
 def calculate_checks(transactions: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    updated = []
-    prev_balance = None
+    to_cents = _to_cents
+    tolerance = TOLERANCE_CENTS
+    prev_cents = None
 
+    # Integer cents: exact add/compare, no per-row round(x, 2)
     for txn in transactions:
-        debit = to_float(txn.get("DEBIT", "0.00"))
-        credit = to_float(txn.get("CREDIT", "0.00"))
-        current_balance = to_float(txn.get("BALANCE", "0.00"))
-
-        if prev_balance is not None:
-            expected = round(prev_balance - debit + credit, 2)
-            actual = round(current_balance, 2)
-            check = abs(expected - actual) <= TOLERANCE
-            txn["Check"] = "TRUE" if check else "FALSE"
-            txn["Check 2"] = f"{abs(expected - actual):.2f}" if not check else "0.00"
-        else:
+        debit = to_cents(txn.get("DEBIT", "0.00"))
+        credit = to_cents(txn.get("CREDIT", "0.00"))
+        current_cents = to_cents(txn.get("BALANCE", "0.00"))
+
+        # The first row has nothing to check against
+        diff = 0
+        if prev_cents is not None:
+            diff = abs(prev_cents - debit + credit - current_cents)
+        if diff <= tolerance:
             txn["Check"] = "TRUE"
             txn["Check 2"] = "0.00"
+        else:
+            txn["Check"] = "FALSE"
+            txn["Check 2"] = f"{diff / 100:.2f}"
+        prev_cents = current_cents
 
-        updated.append(txn)
-        prev_balance = current_balance
+    # A new list of the same (updated) rows, as callers have always received
+    return list(transactions)
 
-    return updated
 
+@lru_cache(maxsize=64)
+def _header_index(headers: Tuple[str, ...]) -> Dict[str, int]:
+    """Column position per header name; a repeated name keeps its last column."""
+    return {h: i for i, h in enumerate(headers)}
 
-def parse_text_row(row: List[str], headers: List[str]) -> Dict[str, str]:
-    standardized_row = STANDARDIZED_ROW.copy()
 
-    if len(row) < len(headers):
-        row.extend([""] * (len(headers) - len(row)))
+def _row_value(row: List[str], idx: Dict[str, int], key: str, default: str) -> str:
+    """
+    The row's cell under header key: default when there is no such header, ""
+    when the row is shorter than the headers.
+    """
+    i = idx.get(key)
+    if i is None:
+        return default
+    return row[i] if i < len(row) else ""
 
-    row_dict = {headers[i]: row[i] if i < len(row) else "" for i in range(len(headers))}
 
-    # Join fragments before normalize_date
-    standardized_row["TXN_DATE"] = normalize_date(
-        join_date_fragments(row_dict.get("TXN_DATE", row_dict.get("VAL_DATE", "")))
-    )
-    standardized_row["VAL_DATE"] = normalize_date(
-        join_date_fragments(row_dict.get("VAL_DATE", row_dict.get("TXN_DATE", "")))
-    )
+# Short REFERENCE values ("NIP", "POS", channel codes) repeat across thousands of rows
+INTERN_MAX_LEN = 64
 
-    standardized_row["REFERENCE"] = row_dict.get("REFERENCE", "")
-    standardized_row["REMARKS"] = row_dict.get("REMARKS", "")
 
-    standardized_row["DEBIT"] = normalize_money(row_dict.get("DEBIT", "0.00"))
-    standardized_row["CREDIT"] = normalize_money(row_dict.get("CREDIT", "0.00"))
-    bal_raw = (row_dict.get("BALANCE", "") or "").strip()
-    standardized_row["BALANCE"] = f"{to_float(bal_raw):.2f}" if bal_raw else ""
+def _intern_short(value: Optional[str]) -> Optional[str]:
+    """One shared object per distinct short str; anything else passes through."""
+    if type(value) is str and len(value) < INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
 
-    # return TransactionRow(**standardized_row)
-    return standardized_row
+
+def parse_text_row(row: List[str], headers: List[str]) -> Dict[str, str]:
+    # Index the row by header position instead of zipping it into a dict (and
+    # without padding the caller's list)
+    idx = _header_index(tuple(headers))
+    # Each date falls back to the other's column when its own is missing
+    txn_key = "TXN_DATE" if "TXN_DATE" in idx else "VAL_DATE"
+    val_key = "VAL_DATE" if "VAL_DATE" in idx else "TXN_DATE"
+    txn_raw = _row_value(row, idx, txn_key, "")
+    val_raw = _row_value(row, idx, val_key, "")
+    # Join fragments before normalize_date; the value date usually repeats the
+    # posting date (or is the same column), so it reuses that result
+    txn_date = normalize_date(join_date_fragments(txn_raw))
+    val_date = (
+        txn_date
+        if val_raw == txn_raw
+        else normalize_date(join_date_fragments(val_raw))
+    )
+    bal_raw = (_row_value(row, idx, "BALANCE", "") or "").strip()
+
+    # Every STANDARDIZED_ROW key is set, so build the row directly (same key order)
+    return {
+        "TXN_DATE": txn_date,
+        "VAL_DATE": val_date,
+        "REFERENCE": _intern_short(_row_value(row, idx, "REFERENCE", "")),
+        "REMARKS": _row_value(row, idx, "REMARKS", ""),
+        "DEBIT": normalize_money(_row_value(row, idx, "DEBIT", "0.00")),
+        "CREDIT": normalize_money(_row_value(row, idx, "CREDIT", "0.00")),
+        "BALANCE": f"{to_float(bal_raw):.2f}" if bal_raw else "",
+        "Check": "",
+        "Check 2": "",
+    }
 
 
 # ------------------------
@@ -439,15 +656,16 @@ def looks_like_year_artifact(row: Dict[str, str]) -> bool:
     - DEBIT and CREDIT are '' or '0.00'
     - BALANCE empty
     """
-    no_remarks = not (row.get("REMARKS") or "").strip()
-    debit = (row.get("DEBIT") or "").strip()
-    credit = (row.get("CREDIT") or "").strip()
-    balance = (row.get("BALANCE") or "").strip()
-    money_empty = debit in {"", "0.00"} and credit in {"", "0.00"} and balance == ""
-    year_only_dates = is_two_digit_year(
-        row.get("TXN_DATE") or ""
-    ) and is_two_digit_year(row.get("VAL_DATE") or "")
-    return no_remarks and money_empty and year_only_dates
+    # Nearly every row fails on its dates, so test those first and stop at the
+    # first failing condition
+    return (
+        is_two_digit_year(row.get("TXN_DATE"))
+        and is_two_digit_year(row.get("VAL_DATE"))
+        and not (row.get("REMARKS") or "").strip()
+        and not (row.get("BALANCE") or "").strip()
+        and (row.get("DEBIT") or "").strip() in {"", "0.00"}
+        and (row.get("CREDIT") or "").strip() in {"", "0.00"}
+    )
 
 
 def merge_year_artifact(prev_row: Dict[str, str], artifact_row: Dict[str, str]) -> bool:
@@ -519,6 +737,27 @@ def merge_and_drop_year_artifacts(rows: List[Dict[str, str]]) -> List[Dict[str,
 # ------------------------
 
 
+def _may_be_encrypted(pdf_path: str) -> bool:
+    """
+    False only when the file cannot be encrypted: an encrypted PDF names its
+    /Encrypt dictionary in a trailer, which is never compressed.
+    """
+    with open(pdf_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return data.find(b"/Encrypt") != -1
+        except ValueError:
+            # Empty file: leave the error to PdfReader
+            return True
+
+
+def _opens_with_empty_password(reader: PdfReader) -> bool:
+    try:
+        return bool(reader.decrypt(""))
+    except Exception:
+        return False
+
+
 def decrypt_pdf(
     pdf_path: str,
     password: str = "",
@@ -528,37 +767,158 @@ def decrypt_pdf(
     """
     Returns (readable_path, effective_path).
     - If encrypted and password is correct: writes a temporary decrypted copy and returns its path.
-    - If not encrypted: returns (pdf_path, pdf_path).
+    - If not encrypted, or readable with an empty password: returns
+      (pdf_path, pdf_path).
     """
+    # Most statements are not encrypted; a byte scan answers that without a PdfReader
+    if not _may_be_encrypted(pdf_path):
+        return pdf_path, effective_path or pdf_path
+
     reader = PdfReader(pdf_path)
-    if reader.is_encrypted:
+    # Owner-password-only PDFs (print/copy restrictions) open with an empty user
+    # password, which pdfplumber applies itself: no decrypted copy is needed.
+    if reader.is_encrypted and not _opens_with_empty_password(reader):
         if not password:
             raise ValueError("Encrypted PDF detected. Please provide a password.")
-        reader.decrypt(password)
-        print("PDF decrypted successfully.", file=sys.stderr)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            writer = PdfWriter()
-            for page in reader.pages:
-                writer.add_page(page)
-            # Preserve original metadata (producer, author, etc.)
-            if reader.metadata:
-                try:
-                    metadata = {
-                        (k if k.startswith("/") else f"/{k}"): str(v)
-                        for k, v in reader.metadata.items()
-                        if v is not None
-                    }
-                    if metadata:
-                        writer.add_metadata(metadata)
-                except Exception as meta_err:
-                    print(
-                        f"Warning: Failed to copy PDF metadata: {meta_err}",
-                        file=sys.stderr,
-                    )
-            writer.write(temp_file)
+        # qpdf (via pikepdf) decrypts and rewrites the file in C, and keeps the
+        # document info/XMP metadata, instead of rebuilding it page by page in Python.
+        # Imported here so unencrypted statements never load the qpdf bindings.
+        import pikepdf
+
+        try:
+            pdf = pikepdf.open(pdf_path, password=password)
+        except pikepdf.PasswordError:
+            raise ValueError("Incorrect password for encrypted PDF.") from None
+        with pdf, tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
+            # Saving without an encryption argument writes an unencrypted copy
+            pdf.save(temp_file)
             temp_file_path = temp_file.name
             effective_path = temp_file_path
+        print("PDF decrypted successfully.", file=sys.stderr)
         return temp_file_path, effective_path or temp_file_path
 
-    # Not encrypted
+    # Not encrypted (or no password needed to read it)
     return pdf_path, effective_path or pdf_path
+
+
+# ------------------------
+# PDF HANDLES
+# ------------------------
+
+# PDFs opened by shared_pdf(), keyed by path; open_pdf() hands these out
+_OPEN_PDFS: Dict[str, "pdfplumber.PDF"] = {}
+
+
+@contextmanager
+def shared_pdf(path: str) -> Iterator[Optional["pdfplumber.PDF"]]:
+    """
+    Opens the PDF once for the duration of the block. open_pdf(path) calls made
+    inside it (detector, parser, metadata) reuse this handle instead of reopening
+    and reparsing the file. Yields None if the file cannot be opened, leaving each
+    caller to open (and report on) it as before.
+    """
+    try:
+        pdf = pdfplumber.open(path)
+    except Exception:
+        yield None
+        return
+    _OPEN_PDFS[path] = pdf
+    try:
+        yield pdf
+    finally:
+        _OPEN_PDFS.pop(path, None)
+        pdf.close()
+
+
+@contextmanager
+def open_pdf(path: str) -> Iterator["pdfplumber.PDF"]:
+    """
+    Drop-in for pdfplumber.open(path): yields the handle from an enclosing
+    shared_pdf(path) if there is one (leaving it open), else opens and closes its own.
+    """
+    pdf = _OPEN_PDFS.get(path)
+    if pdf is not None:
+        yield pdf
+        return
+    with pdfplumber.open(path) as pdf:
+        yield pdf
+
+
+# ------------------------
+# PAGE WORKERS
+# ------------------------
+
+# Below this many pages, worker start-up and re-opening the PDF cost more than they save
+PARALLEL_MIN_PAGES = 8
+
+_T = TypeVar("_T")
+
+# Cleared by disable_page_workers() in processes that already parse whole statements
+_PAGE_WORKERS_ENABLED = True
+
+
+def disable_page_workers() -> None:
+    """
+    Keep page extraction in-process from now on. Pool initializer for batch workers:
+    each already handles a whole statement, and a page pool inside every one of
+    them would multiply the process count.
+    """
+    global _PAGE_WORKERS_ENABLED
+    _PAGE_WORKERS_ENABLED = False
+
+
+def page_run_workers(page_count: int) -> int:
+    """Processes to spread a page_count-page PDF across; 1 means stay in-process."""
+    if not _PAGE_WORKERS_ENABLED or page_count < PARALLEL_MIN_PAGES:
+        return 1
+    return min(os.cpu_count() or 1, page_count)
+
+
+def _map_page_run(
+    path: str, page_nums: List[int], worker: Callable[..., _T]
+) -> List[_T]:
+    """Pool entry point: open the PDF once and apply worker to a run of its pages."""
+    with pdfplumber.open(path, pages=page_nums) as pdf:
+        return [worker(page, page_num) for page_num, page in zip(page_nums, pdf.pages)]
+
+
+def map_page_runs(path: str, page_count: int, worker: Callable[..., _T]) -> List[_T]:
+    """
+    worker(page, page_num) for every page of the PDF, in page order. Pages are
+    independent, so each of page_run_workers(page_count) processes takes one
+    contiguous run of them; worker must be a module-level (picklable) function.
+    """
+    workers = page_run_workers(page_count)
+    page_nums = list(range(1, page_count + 1))
+    step = -(-page_count // workers)
+    runs = [page_nums[i : i + step] for i in range(0, page_count, step)]
+    results: List[_T] = []
+    with ProcessPoolExecutor(max_workers=len(runs)) as executor:
+        for run_results in executor.map(
+            _map_page_run, repeat(path), runs, repeat(worker)
+        ):
+            results.extend(run_results)
+    return results
+
+
+# ------------------------
+# PDF TEXT
+# ------------------------
+
+
+@lru_cache(maxsize=8)
+def _first_page_text(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    with open_pdf(path) as pdf:
+        if not pdf.pages:
+            return None
+        return pdf.pages[0].extract_text() or ""
+
+
+def first_page_text(path: str) -> Optional[str]:
+    """
+    Returns the extracted text of the PDF's first page ("" if it has no text),
+    or None if the PDF has no pages.
+    Cached per file version, so a detector and the parser it picks extract it once.
+    """
+    st = os.stat(path)
+    return _first_page_text(path, st.st_mtime_ns, st.st_size)
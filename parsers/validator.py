@@ -1,11 +1,22 @@
 from typing import List, Dict
 
+# Share of rows whose balance check must pass (a 90% target is not enforced yet)
+MIN_SUCCESS_RATE = 0.0
+
 
 def is_valid_parse(transactions: List[Dict[str, str]]) -> bool:
     if not transactions:
         return False
-    true_checks = sum(
-        1 for txn in transactions if txn.get("Check", "").upper() == "TRUE"
-    )
-    success_rate = true_checks / len(transactions)
-    return success_rate >= 0.0  # 90% threshold; adjust as needed
+    total = len(transactions)
+    true_checks = 0
+    for seen, txn in enumerate(transactions):
+        # Stop as soon as the outcome is settled: reached already, or out of reach
+        # even if every remaining row passes
+        if true_checks / total >= MIN_SUCCESS_RATE:
+            return True
+        if (true_checks + total - seen) / total < MIN_SUCCESS_RATE:
+            return False
+        if txn.get("Check", "").upper() == "TRUE":
+            true_checks += 1
+    success_rate = true_checks / total
+    return success_rate >= MIN_SUCCESS_RATE